@@ -0,0 +1,64 @@
+import asyncio
+import functools
+import queue
+import threading
+
+from rich.prompt import Prompt, IntPrompt, Confirm
+
+
+class InputThread(threading.Thread):
+    
+    def __init__(self):
+        super().__init__(name="prompt-input", daemon=True)
+        self.requests: queue.Queue = queue.Queue()
+    
+    def run(self):
+        while True:
+            func, future, loop = self.requests.get()
+            try:
+                result = func()
+            except BaseException as e:
+                loop.call_soon_threadsafe(self._set_exception, future, e)
+            else:
+                loop.call_soon_threadsafe(self._set_result, future, result)
+    
+    @staticmethod
+    def _set_result(future: asyncio.Future, result):
+        if not future.done():
+            future.set_result(result)
+    
+    @staticmethod
+    def _set_exception(future: asyncio.Future, error: BaseException):
+        if not future.done():
+            future.set_exception(error)
+    
+    def submit(self, func) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.requests.put((func, future, loop))
+        return future
+
+
+_input_thread = None
+
+
+async def _run(func, *args, **kwargs):
+    global _input_thread
+    
+    if _input_thread is None:
+        _input_thread = InputThread()
+        _input_thread.start()
+    
+    return await _input_thread.submit(functools.partial(func, *args, **kwargs))
+
+
+async def ask(*args, **kwargs) -> str:
+    return await _run(Prompt.ask, *args, **kwargs)
+
+
+async def ask_int(*args, **kwargs) -> int:
+    return await _run(IntPrompt.ask, *args, **kwargs)
+
+
+async def confirm(*args, **kwargs) -> bool:
+    return await _run(Confirm.ask, *args, **kwargs)
@@ -0,0 +1,268 @@
+import asyncio
+import gc
+import io
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from importlib.metadata import version
+from types import SimpleNamespace
+from typing import Callable
+from rich.console import Console
+from rich.table import Table
+import telethon
+from telethon.tl.types import Chat, Channel, ChatPhotoEmpty, User
+import config
+from group_manager import GroupManager
+from main import build_group_table, build_selection_table
+
+console = Console()
+
+
+class SyntheticClient:
+    
+    def __init__(self, dialogs: list):
+        self.dialogs = dialogs
+    
+    async def iter_dialogs(self):
+        for dialog in self.dialogs:
+            yield dialog
+
+
+def generate_dialogs(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    dialogs = []
+    
+    for i in range(count):
+        entity_id = 1_000_000 + i
+        title = f"Grup {i} " + "x" * rng.randint(0, 40)
+        kind = rng.random()
+        
+        if kind < 0.15:
+            entity = User(id=entity_id, first_name=title)
+        elif kind < 0.40:
+            entity = Chat(
+                id=entity_id,
+                title=title,
+                photo=ChatPhotoEmpty(),
+                participants_count=rng.randint(2, 200),
+                date=date,
+                version=1
+            )
+        elif kind < 0.85:
+            entity = Channel(
+                id=entity_id,
+                title=title,
+                photo=ChatPhotoEmpty(),
+                date=date,
+                megagroup=True,
+                access_hash=rng.getrandbits(63),
+                participants_count=rng.randint(10, 200_000)
+            )
+        else:
+            entity = Channel(
+                id=entity_id,
+                title=title,
+                photo=ChatPhotoEmpty(),
+                date=date,
+                broadcast=True,
+                creator=rng.random() < 0.5,
+                access_hash=rng.getrandbits(63)
+            )
+        
+        dialogs.append(SimpleNamespace(entity=entity, title=title))
+    
+    return dialogs
+
+
+def measure(func: Callable, repeats: int) -> dict:
+    timings = []
+    for _ in range(repeats):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+    
+    retained = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return {
+        "time_ms": round(min(timings) * 1000, 2),
+        "peak_kb": round(peak / 1024, 1),
+        "retained_blocks": retained
+    }
+
+
+def render(table: Table) -> str:
+    output = io.StringIO()
+    Console(file=output, width=120, force_terminal=True).print(table)
+    return output.getvalue()
+
+
+def run_size(size: int, repeats: int) -> dict:
+    client = SyntheticClient(generate_dialogs(size))
+    manager = GroupManager(client)
+    
+    results = {"fetch": measure(lambda: asyncio.run(manager.fetch_groups()), repeats)}
+    groups = manager.list_groups()
+    
+    selection = ",".join(str(i) for i in range(1, len(groups) + 1, 2))
+    selected = manager.select_groups(selection)
+    
+    results["group_table"] = measure(lambda: build_group_table(groups), repeats)
+    results["select"] = measure(lambda: manager.select_groups(selection), repeats)
+    results["selection_table"] = measure(lambda: build_selection_table(groups, selected), repeats)
+    results["render"] = measure(lambda: render(build_group_table(groups)), repeats)
+    return results
+
+
+def load_baseline() -> dict:
+    if not config.BENCHMARK_BASELINE_PATH.exists():
+        return {}
+    return json.loads(config.BENCHMARK_BASELINE_PATH.read_text(encoding="utf-8"))
+
+
+def scaling(report: dict) -> dict:
+    sizes = sorted(int(size) for size in report)
+    if len(sizes) < 2:
+        return {}
+    
+    small, large = str(sizes[0]), str(sizes[-1])
+    return {
+        f"{large}/{small}": {
+            stage: round(report[large][stage]["time_ms"] / max(report[small][stage]["time_ms"], 0.01), 2)
+            for stage in report[large]
+        }
+    }
+
+
+def compare(report: dict, ratios: dict, baseline: dict) -> tuple[list[str], list[str]]:
+    regressions = []
+    missing = []
+    
+    for size, stages in report.items():
+        for stage, current in stages.items():
+            reference = baseline.get("sizes", {}).get(size, {}).get(stage)
+            if not reference:
+                missing.append(f"{size}/{stage}")
+                continue
+            
+            for metric in ("peak_kb", "retained_blocks"):
+                limit = reference[metric] * (1 + config.BENCHMARK_TOLERANCE)
+                if metric == "retained_blocks":
+                    limit += config.BENCHMARK_BLOCK_SLACK
+                if current[metric] > limit:
+                    regressions.append(f"{size}/{stage} {metric}: {current[metric]} > {reference[metric]}")
+    
+    for pair, stages in ratios.items():
+        large, small = (int(size) for size in pair.split("/"))
+        for stage, ratio in stages.items():
+            reference = baseline.get("scaling", {}).get(pair, {}).get(stage)
+            if reference is None:
+                missing.append(f"{pair}/{stage}")
+            
+            limit = max(reference or 0, large / small) * (1 + config.BENCHMARK_SCALING_TOLERANCE)
+            if ratio > limit:
+                regressions.append(f"{pair}/{stage} süre oranı: {ratio}x > {limit:.1f}x")
+    
+    return regressions, missing
+
+
+def save_baseline(baseline: dict, report: dict, ratios: dict):
+    sizes = baseline.setdefault("sizes", {})
+    for size, stages in report.items():
+        sizes[size] = {
+            stage: {metric: values[metric] for metric in ("peak_kb", "retained_blocks")}
+            for stage, values in stages.items()
+        }
+    baseline.setdefault("scaling", {}).update(ratios)
+    baseline["environment"] = {
+        "python": platform.python_version(),
+        "telethon": telethon.__version__,
+        "rich": version("rich")
+    }
+    config.BENCHMARK_BASELINE_PATH.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+
+
+def main() -> int:
+    sizes = [int(arg) for arg in sys.argv[1:] if arg.isdigit()] or list(config.BENCHMARK_SIZES)
+    save = "--save-baseline" in sys.argv
+    check = "--check" in sys.argv
+    baseline = load_baseline()
+    
+    report = {}
+    for size in sizes:
+        with console.status(f"[bold green]{size} diyalog ölçülüyor..."):
+            report[str(size)] = run_size(size, config.BENCHMARK_REPEATS)
+    ratios = scaling(report)
+    
+    table = Table(title="Büyük Hesap Ölçüm Sonuçları")
+    table.add_column("Diyalog", style="cyan")
+    table.add_column("Aşama", style="green")
+    table.add_column("Süre (ms)", style="yellow")
+    table.add_column("Tepe Bellek (KB)", style="magenta")
+    table.add_column("Kalan Blok", style="blue")
+    table.add_column("Referans Bellek (KB)")
+    
+    for size, stages in report.items():
+        for stage, current in stages.items():
+            reference = baseline.get("sizes", {}).get(size, {}).get(stage)
+            table.add_row(
+                size,
+                stage,
+                str(current['time_ms']),
+                str(current['peak_kb']),
+                str(current['retained_blocks']),
+                str(reference['peak_kb']) if reference else "-"
+            )
+    console.print(table)
+    
+    for pair, stages in ratios.items():
+        table = Table(title=f"Süre Ölçeklenmesi ({pair})")
+        table.add_column("Aşama", style="green")
+        table.add_column("Oran", style="yellow")
+        table.add_column("Referans Oran")
+        
+        for stage, ratio in stages.items():
+            reference = baseline.get("scaling", {}).get(pair, {}).get(stage)
+            table.add_row(stage, f"{ratio}x", f"{reference}x" if reference is not None else "-")
+        console.print(table)
+    
+    if save:
+        save_baseline(baseline, report, ratios)
+        console.print(f"[bold green]✅ Referans kaydedildi: {config.BENCHMARK_BASELINE_PATH}[/bold green]")
+        return 0
+    
+    regressions, missing = compare(report, ratios, baseline)
+    
+    if regressions:
+        console.print("[bold red]❌ Ölçeklenme gerilemesi:[/bold red]")
+        for line in regressions:
+            console.print(f"   {line}")
+        return 1
+    
+    if missing:
+        if check:
+            console.print(f"[bold red]❌ Referansı olmayan ölçümler: {', '.join(missing)}[/bold red]")
+            console.print("   Önce '--save-baseline' ile referans kaydedin.")
+            return 1
+        console.print("[yellow]⚠️  Bazı ölçümlerin referansı yok, '--save-baseline' ile oluşturun.[/yellow]")
+        return 0
+    
+    console.print("[bold green]✅ Bellek ve süre ölçeklenmesi referans içinde.[/bold green]")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,12 +9,52 @@ SESSIONS_DIR = BASE_DIR / "sessions"
 
 SESSIONS_DIR.mkdir(exist_ok=True)
 
+STATS_DB_PATH = BASE_DIR / "send_stats.db"
+SETTINGS_PATH = BASE_DIR / "settings.json"
+PROFILE_DIR = BASE_DIR / "profiles"
+RESOLVE_CACHE_PATH = BASE_DIR / "resolve_cache.db"
+
 API_ID = os.getenv("API_ID")
 API_HASH = os.getenv("API_HASH")
 
 DEFAULT_MESSAGE_DELAY = 60
 DEFAULT_GROUP_DELAY = 30
 DEFAULT_LOOP_DELAY = 300
+SETTINGS_RELOAD_INTERVAL = 5
+
+DEFAULT_DISPATCH_MODE = "direct"
+FORWARD_SOURCE_CHAT = os.getenv("FORWARD_SOURCE_CHAT", "me")
+
+CONNECTION_CHECK_INTERVAL = 1
+RECONNECT_BASE_DELAY = 1
+RECONNECT_MAX_DELAY = 60
+RECONNECT_MAX_ATTEMPTS = 10
+DELIVERY_CHECK_LIMIT = 10
+DELIVERY_CLOCK_SKEW = 30
+
+RESOLVE_TTL = 7 * 24 * 3600
+RESOLVE_NEGATIVE_TTL = 6 * 3600
+
+PLAN_SEND_LATENCY = 0.5
+PLAN_UPLOAD_BYTES_PER_SEC = 512 * 1024
+PLAN_LOOP_PASSES = 3
+PLAN_TOP_BOTTLENECKS = 5
+
+DAEMON_HOST = os.getenv("DAEMON_HOST", "127.0.0.1")
+DAEMON_PORT = int(os.getenv("DAEMON_PORT", "8765"))
+DAEMON_TOKEN = os.getenv("DAEMON_TOKEN", "")
+DAEMON_ALLOWED_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+PROFILE_ENABLED = os.getenv("TBM_PROFILE", "").lower() in ("1", "true", "yes")
+PROFILE_SAMPLE_INTERVAL = 0.005
+PROFILE_FLUSH_INTERVAL = 60
+
+BENCHMARK_BASELINE_PATH = BASE_DIR / "benchmark_baseline.json"
+BENCHMARK_SIZES = (5000, 10000, 20000)
+BENCHMARK_REPEATS = 5
+BENCHMARK_TOLERANCE = 0.25
+BENCHMARK_SCALING_TOLERANCE = 1.0
+BENCHMARK_BLOCK_SLACK = 64
 
 def validate_credentials() -> bool:
     if not API_ID or not API_HASH:
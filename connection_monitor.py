@@ -0,0 +1,135 @@
+import asyncio
+import random
+import time
+from typing import Callable, Optional
+from telethon import TelegramClient
+import config
+
+
+class ConnectionMonitor:
+    
+    def __init__(self, client: TelegramClient):
+        self.client = client
+        self.drops = 0
+        self.reconnects = 0
+        self.downtime = 0.0
+        self.last_error: Optional[str] = None
+        self._down_since: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+    
+    def is_connected(self) -> bool:
+        return self.client.is_connected()
+    
+    def _link_up(self) -> bool:
+        # is_connected() stays True while Telethon retries internally;
+        # the sender's transport state also reflects those short drops.
+        sender = getattr(self.client, "_sender", None)
+        transport_connected = getattr(sender, "_transport_connected", None)
+        if callable(transport_connected):
+            return bool(transport_connected())
+        return self.is_connected()
+    
+    def mark_down(self):
+        if self._down_since is None:
+            self._down_since = time.monotonic()
+            self.drops += 1
+    
+    def _mark_up(self):
+        if self._down_since is not None:
+            self.downtime += time.monotonic() - self._down_since
+            self._down_since = None
+            self.reconnects += 1
+    
+    def observe(self) -> bool:
+        up = self._link_up()
+        if not up:
+            self.mark_down()
+        else:
+            self._mark_up()
+        return up
+    
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._watch())
+    
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        
+        if self._down_since is not None:
+            self.downtime += time.monotonic() - self._down_since
+            self._down_since = None
+    
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(config.CONNECTION_CHECK_INTERVAL)
+            try:
+                self.observe()
+                if not self.is_connected():
+                    await self.reconnect()
+            except Exception as e:
+                self.last_error = str(e) or type(e).__name__
+    
+    async def reconnect(self, should_continue: Optional[Callable[[], bool]] = None) -> bool:
+        should_continue = should_continue or (lambda: True)
+        
+        async with self._lock:
+            if self.is_connected():
+                self.observe()
+                return True
+            
+            self.mark_down()
+            for attempt in range(config.RECONNECT_MAX_ATTEMPTS):
+                if not should_continue():
+                    return False
+                
+                try:
+                    await self.client.connect()
+                except Exception as e:
+                    self.last_error = str(e) or type(e).__name__
+                
+                if self.is_connected():
+                    self._mark_up()
+                    return True
+                
+                backoff = min(
+                    config.RECONNECT_MAX_DELAY,
+                    config.RECONNECT_BASE_DELAY * 2 ** attempt
+                )
+                deadline = time.monotonic() + random.uniform(0, backoff)
+                while should_continue() and time.monotonic() < deadline:
+                    await asyncio.sleep(min(1, deadline - time.monotonic()))
+            return False
+    
+    async def wait_connected(self, should_continue: Optional[Callable[[], bool]] = None) -> bool:
+        should_continue = should_continue or (lambda: True)
+        
+        while not self.is_connected():
+            if not should_continue():
+                return False
+            if self._lock.locked():
+                await asyncio.sleep(config.RECONNECT_BASE_DELAY)
+            elif not await self.reconnect(should_continue):
+                return False
+        
+        self.observe()
+        return True
+    
+    def stats(self) -> dict:
+        downtime = self.downtime
+        if self._down_since is not None:
+            downtime += time.monotonic() - self._down_since
+        
+        return {
+            "connected": self.is_connected(),
+            "drops": self.drops,
+            "reconnects": self.reconnects,
+            "downtime": downtime,
+            "last_error": self.last_error
+        }
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+
+import asyncio
+import hmac
+import json
+import sys
+from typing import Optional
+from urllib.parse import urlsplit, parse_qs
+
+import config
+from session_manager import SessionManager
+from group_manager import GroupManager
+from message_sender import MessageSender
+from send_job import SendJob
+from send_stats import SendStatsStore
+from sender_settings import SenderSettings, DISPATCH_MODES
+from resolve_cache import ResolveCache
+
+from rich.console import Console
+
+console = Console()
+
+HTTP_REASONS = {
+    200: "OK",
+    201: "Created",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    415: "Unsupported Media Type",
+    500: "Internal Server Error",
+}
+
+
+class HttpError(Exception):
+    
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class SenderDaemon:
+    
+    def __init__(self, host: str = config.DAEMON_HOST, port: int = config.DAEMON_PORT):
+        self.host = host
+        self.port = port
+        self.session_manager = SessionManager()
+        self.stats_store = SendStatsStore()
+        self.settings = SenderSettings()
+        self.settings.last_sent.update(self.stats_store.last_sent_times())
+        self.resolve_cache = ResolveCache()
+        self.group_managers: dict[str, GroupManager] = {}
+        self.jobs: dict[int, SendJob] = {}
+        self._next_job_id = 1
+        self._submitting: set[str] = set()
+        self.server: Optional[asyncio.AbstractServer] = None
+    
+    async def load_accounts(self):
+        for phone in self.session_manager.list_saved_sessions():
+            success, msg = await self.session_manager.load_session(phone)
+            if not success:
+                console.print(f"[red]❌ {phone}: {msg}[/red]")
+                continue
+            
+            group_manager = GroupManager(
+                self.session_manager.clients[phone],
+                account=phone,
+                resolve_cache=self.resolve_cache
+            )
+            groups = await group_manager.fetch_groups()
+            self.group_managers[phone] = group_manager
+            console.print(f"[green]✅ {phone}: {len(groups)} grup yüklendi.[/green]")
+    
+    def _get_group_manager(self, account: Optional[str]) -> tuple[str, GroupManager]:
+        if not self.group_managers:
+            raise HttpError(409, "Yüklü hesap yok.")
+        
+        if account is None:
+            account = next(iter(self.group_managers))
+        
+        group_manager = self.group_managers.get(account)
+        if not group_manager:
+            raise HttpError(404, f"Hesap bulunamadı: {account}")
+        return account, group_manager
+    
+    def _active_job(self, account: str) -> Optional[SendJob]:
+        for job in self.jobs.values():
+            if job.account == account and job.is_active():
+                return job
+        return None
+    
+    def _get_job(self, job_id: str) -> SendJob:
+        job = self.jobs.get(int(job_id)) if job_id.isdigit() else None
+        if not job:
+            raise HttpError(404, f"Görev bulunamadı: {job_id}")
+        return job
+    
+    def _connection_stats(self, phone: str) -> Optional[dict]:
+        monitor = self.session_manager.get_monitor(phone)
+        return monitor.stats() if monitor else None
+    
+    async def list_accounts(self, query: dict, body: dict):
+        return [
+            {
+                "account": phone,
+                "groups": len(group_manager.list_groups()),
+                "busy": self._active_job(phone) is not None or phone in self._submitting,
+                "connection": self._connection_stats(phone)
+            }
+            for phone, group_manager in self.group_managers.items()
+        ]
+    
+    async def list_groups(self, query: dict, body: dict):
+        _, group_manager = self._get_group_manager(query.get("account"))
+        return [
+            {"id": g["id"], "title": g["title"], "type": g["type"], "members": g["members"]}
+            for g in group_manager.list_groups()
+        ]
+    
+    async def refresh_groups(self, query: dict, body: dict):
+        _, group_manager = self._get_group_manager(body.get("account"))
+        groups = await group_manager.fetch_groups()
+        return {"groups": len(groups)}
+    
+    async def _resolve_targets(self, group_manager: GroupManager, body: dict) -> list[dict]:
+        group_ids = body.get("group_ids")
+        usernames = body.get("usernames") or []
+        if group_ids is None and not usernames:
+            return list(group_manager.list_groups())
+        
+        groups = []
+        for group_id in group_ids or []:
+            group = group_manager.get_group_by_id(group_id)
+            if not group:
+                raise HttpError(404, f"Grup bulunamadı: {group_id}")
+            groups.append(group)
+        
+        for username in usernames:
+            target, error = await group_manager.resolve_username(username)
+            if error:
+                raise HttpError(404, f"Grup çözümlenemedi: {username} ({error})")
+            groups.append(target)
+        return groups
+    
+    async def submit_job(self, query: dict, body: dict):
+        account, group_manager = self._get_group_manager(body.get("account"))
+        
+        message = body.get("message")
+        if not message:
+            raise HttpError(400, "Mesaj boş olamaz.")
+        
+        dispatch_mode = body.get("dispatch_mode")
+        if dispatch_mode is not None and dispatch_mode not in DISPATCH_MODES:
+            raise HttpError(400, f"Geçersiz gönderim modu: {dispatch_mode}")
+        
+        if self._active_job(account) or account in self._submitting:
+            raise HttpError(409, f"{account} için zaten çalışan bir görev var.")
+        
+        # Reserve the account across the await so a concurrent request can't
+        # slip a second job in before this one is registered.
+        self._submitting.add(account)
+        try:
+            groups = await self._resolve_targets(group_manager, body)
+        finally:
+            self._submitting.discard(account)
+        
+        if not groups:
+            raise HttpError(400, "Hedef grup yok.")
+        
+        sender = MessageSender(
+            self.session_manager.clients[account],
+            account=account,
+            stats_store=self.stats_store,
+            settings=self.settings,
+            connection=self.session_manager.get_monitor(account)
+        )
+        
+        job = SendJob(
+            self._next_job_id,
+            account,
+            sender,
+            groups,
+            message,
+            image_path=body.get("image_path"),
+            loop=bool(body.get("loop", False)),
+            dispatch_mode=dispatch_mode
+        )
+        self._next_job_id += 1
+        self.jobs[job.id] = job
+        job.start()
+        return job.to_dict()
+    
+    async def list_jobs(self, query: dict, body: dict):
+        return [job.to_dict() for job in self.jobs.values()]
+    
+    async def get_job(self, query: dict, body: dict, job_id: str):
+        return self._get_job(job_id).to_dict()
+    
+    async def cancel_job(self, query: dict, body: dict, job_id: str):
+        job = self._get_job(job_id)
+        job.cancel()
+        return job.to_dict()
+    
+    def authorize(self, method: str, headers: dict):
+        host = headers.get("host", "")
+        hostname = urlsplit(f"//{host}").hostname
+        if hostname not in config.DAEMON_ALLOWED_HOSTS:
+            raise HttpError(403, f"İzin verilmeyen Host: {host}")
+        
+        scheme, _, token = headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(token.strip().encode("latin-1"), config.DAEMON_TOKEN.encode("utf-8")):
+            raise HttpError(401, "Geçersiz veya eksik token.")
+        
+        if method == "POST":
+            content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+            if content_type != "application/json":
+                raise HttpError(415, "Content-Type: application/json gerekli.")
+    
+    def route(self, method: str, path: str):
+        parts = [p for p in path.split("/") if p]
+        
+        routes = {
+            ("GET", ("accounts",)): self.list_accounts,
+            ("GET", ("groups",)): self.list_groups,
+            ("POST", ("groups", "refresh")): self.refresh_groups,
+            ("GET", ("jobs",)): self.list_jobs,
+            ("POST", ("jobs",)): self.submit_job,
+        }
+        
+        handler = routes.get((method, tuple(parts)))
+        if handler:
+            return handler, []
+        
+        if len(parts) == 2 and parts[0] == "jobs" and method == "GET":
+            return self.get_job, [parts[1]]
+        if len(parts) == 3 and parts[0] == "jobs" and parts[2] == "cancel" and method == "POST":
+            return self.cancel_job, [parts[1]]
+        
+        if any(key[1] == tuple(parts) for key in routes):
+            raise HttpError(405, f"Desteklenmeyen metot: {method}")
+        raise HttpError(404, f"Bilinmeyen yol: {path}")
+    
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        status, payload = 200, None
+        
+        try:
+            request_line = (await reader.readline()).decode("latin-1").strip()
+            if not request_line:
+                writer.close()
+                return
+            
+            method, target, _ = request_line.split(" ", 2)
+            
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode("latin-1").strip()
+                if not line:
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            
+            self.authorize(method.upper(), headers)
+            
+            body = {}
+            length = int(headers.get("content-length", 0))
+            if length:
+                raw = await reader.readexactly(length)
+                try:
+                    body = json.loads(raw)
+                except ValueError:
+                    raise HttpError(400, "Geçersiz JSON.")
+                if not isinstance(body, dict):
+                    raise HttpError(400, "JSON nesnesi bekleniyor.")
+            
+            url = urlsplit(target)
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            
+            handler, args = self.route(method.upper(), url.path)
+            payload = await handler(query, body, *args)
+            if method.upper() == "POST" and handler == self.submit_job:
+                status = 201
+        
+        except HttpError as e:
+            status, payload = e.status, {"error": e.message}
+        except (ValueError, asyncio.IncompleteReadError) as e:
+            status, payload = 400, {"error": f"Geçersiz istek: {e}"}
+        except Exception as e:
+            status, payload = 500, {"error": str(e)}
+        
+        try:
+            data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            writer.write(
+                f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                f"Connection: close\r\n\r\n".encode("latin-1") + data
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+    
+    async def run(self):
+        if not config.validate_credentials():
+            console.print("[bold red]❌ HATA: API bilgileri yapılandırılmamış![/bold red]")
+            return
+        
+        if not config.DAEMON_TOKEN:
+            console.print("[bold red]❌ HATA: .env içinde DAEMON_TOKEN tanımlanmamış![/bold red]")
+            return
+        
+        await self.load_accounts()
+        
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        console.print(f"[bold blue]🛰️  Daemon dinliyor: http://{self.host}:{self.port}[/bold blue]")
+        
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            for job in self.jobs.values():
+                job.cancel()
+            tasks = [job.task for job in self.jobs.values() if job.task]
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            await self.session_manager.disconnect_all()
+            self.stats_store.close()
+            self.resolve_cache.close()
+
+
+def main():
+    if "--profile" in sys.argv or config.PROFILE_ENABLED:
+        import profiling
+        console.print(f"[bold magenta]🔬 {profiling.install()}[/bold magenta]")
+    
+    daemon = SenderDaemon()
+    
+    try:
+        asyncio.run(daemon.run())
+    except KeyboardInterrupt:
+        console.print("\n[bold blue]👋 Daemon durduruldu.[/bold blue]")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,31 @@
 from typing import Optional
 from telethon import TelegramClient
-from telethon.tl.types import Chat, Channel, User
+from telethon.errors import (
+    ChannelInvalidError,
+    InviteHashExpiredError,
+    InviteHashInvalidError,
+    UserAlreadyParticipantError,
+    UsernameInvalidError,
+    UsernameNotOccupiedError,
+)
+from telethon.tl.types import Chat, Channel, User, InputPeerChannel, ChatInviteAlready
 from telethon.tl.functions.channels import JoinChannelRequest
-from telethon.tl.functions.messages import ImportChatInviteRequest
+from telethon.tl.functions.contacts import ResolveUsernameRequest
+from telethon.tl.functions.messages import CheckChatInviteRequest, ImportChatInviteRequest
+from resolve_cache import ResolveCache
 
 
 class GroupManager:
     
-    def __init__(self, client: TelegramClient):
+    def __init__(
+        self,
+        client: TelegramClient,
+        account: Optional[str] = None,
+        resolve_cache: Optional[ResolveCache] = None
+    ):
         self.client = client
+        self.account = account or ""
+        self.resolve_cache = resolve_cache
         self.groups: list[dict] = []
     
     async def fetch_groups(self) -> list[dict]:
@@ -48,11 +65,82 @@ class GroupManager:
     def list_groups(self) -> list[dict]:
         return self.groups
     
+    def select_groups(self, selection: str, groups: Optional[list[dict]] = None) -> list[dict]:
+        groups = self.groups if groups is None else groups
+        selection = selection.strip().lower()
+        
+        if selection == "all":
+            return groups.copy()
+        if selection == "clear":
+            return []
+        
+        selected = []
+        seen = set()
+        for part in selection.split(","):
+            idx = int(part.strip()) - 1
+            if 0 <= idx < len(groups) and idx not in seen:
+                seen.add(idx)
+                selected.append(groups[idx])
+        return selected
+    
+    def _cache_key(self, value: str) -> str:
+        return f"{self.account}:{value}"
+    
+    async def resolve_username(self, username: str) -> tuple[Optional[dict], Optional[str]]:
+        username = username.lstrip("@").lower()
+        key = self._cache_key(username)
+        
+        entry = self.resolve_cache.get("username", key) if self.resolve_cache else None
+        if entry is None:
+            try:
+                result = await self.client(ResolveUsernameRequest(username))
+            except UsernameNotOccupiedError:
+                entry = {"status": "not_found"}
+            except UsernameInvalidError:
+                entry = {"status": "invalid"}
+            else:
+                entry = {"status": "user"}
+                peer_id = getattr(result.peer, "channel_id", None)
+                for chat in result.chats:
+                    if isinstance(chat, Channel) and chat.id == peer_id:
+                        entry = {
+                            "status": "ok",
+                            "id": chat.id,
+                            "access_hash": chat.access_hash,
+                            "title": chat.title
+                        }
+                        break
+            
+            if self.resolve_cache:
+                self.resolve_cache.put("username", key, entry["status"], entry)
+        
+        if entry["status"] != "ok":
+            return None, entry["status"]
+        
+        return {
+            "id": entry["id"],
+            "title": entry["title"],
+            "entity": InputPeerChannel(entry["id"], entry["access_hash"])
+        }, None
+    
     async def join_by_username(self, username: str) -> tuple[bool, str]:
         try:
             username = username.lstrip("@")
             
-            await self.client(JoinChannelRequest(username))
+            target, error = await self.resolve_username(username)
+            if error == "not_found":
+                return False, f"'{username}' kullanıcısı veya grubu bulunamadı."
+            if error == "user":
+                return False, f"'{username}' bir kullanıcı, gruba katılınamaz."
+            if error == "invalid":
+                return False, "Geçersiz kullanıcı adı formatı."
+            
+            try:
+                await self.client(JoinChannelRequest(target["entity"]))
+            except ChannelInvalidError:
+                if self.resolve_cache:
+                    self.resolve_cache.invalidate("username", self._cache_key(username.lower()))
+                raise
             
             await self.fetch_groups()
             
@@ -60,10 +148,6 @@ class GroupManager:
             
         except Exception as e:
             error_msg = str(e)
-            if "Cannot find any entity" in error_msg:
-                return False, f"'{username}' kullanıcısı veya grubu bulunamadı."
-            if "UsernameInvalidError" in error_msg:
-                return False, "Geçersiz kullanıcı adı formatı."
             return False, f"Katılım hatası: {error_msg}"
     
     async def join_by_invite(self, invite_link: str) -> tuple[bool, str]:
@@ -78,17 +162,46 @@ class GroupManager:
                 invite_hash = invite_link.split("joinchat/")[-1]
             
             invite_hash = invite_hash.strip().rstrip("/")
+            key = self._cache_key(invite_hash)
             
-            await self.client(ImportChatInviteRequest(invite_hash))
+            preview = self.resolve_cache.get("invite", key) if self.resolve_cache else None
+            if preview is None:
+                try:
+                    invite = await self.client(CheckChatInviteRequest(invite_hash))
+                except (InviteHashExpiredError, InviteHashInvalidError):
+                    preview = {"status": "invalid"}
+                else:
+                    if isinstance(invite, ChatInviteAlready):
+                        return False, "Zaten bu grubun üyesisiniz."
+                    chat = getattr(invite, "chat", None)
+                    preview = {
+                        "status": "ok",
+                        "title": getattr(invite, "title", None) or getattr(chat, "title", "")
+                    }
+                
+                if self.resolve_cache:
+                    self.resolve_cache.put("invite", key, preview["status"], preview)
+            
+            if preview["status"] != "ok":
+                return False, "Davet linki geçersiz veya süresi dolmuş."
+            
+            try:
+                await self.client(ImportChatInviteRequest(invite_hash))
+            except UserAlreadyParticipantError:
+                return False, "Zaten bu grubun üyesisiniz."
+            except (InviteHashExpiredError, InviteHashInvalidError):
+                if self.resolve_cache:
+                    self.resolve_cache.put("invite", key, "invalid", {"status": "invalid"})
+                return False, "Davet linki geçersiz veya süresi dolmuş."
             
             await self.fetch_groups()
             
+            if preview.get("title"):
+                return True, f"{preview['title']} grubuna katıldınız!"
             return True, "Gruba katıldınız!"
             
         except Exception as e:
             error_msg = str(e)
-            if "UserAlreadyParticipantError" in error_msg:
-                return False, "Zaten bu grubun üyesisiniz."
             return False, f"Katılım hatası: {error_msg}"
     
     async def join_group(self, link_or_username: str) -> tuple[bool, str]:
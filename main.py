@@ -9,16 +9,47 @@ import config
 from session_manager import SessionManager
 from group_manager import GroupManager
 from message_sender import MessageSender
+from send_stats import SendStatsStore
+from sender_settings import SenderSettings, DISPATCH_MODES, GROUP_TYPES
+from resolve_cache import ResolveCache
+from send_job import SendJob
+import async_prompt
 
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.prompt import Prompt, IntPrompt, Confirm
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
 
 console = Console()
 
 
+def build_group_table(groups: list[dict]) -> Table:
+    table = Table(title=f"Gruplarınız ({len(groups)} adet)")
+    table.add_column("No", style="cyan")
+    table.add_column("Tip", style="magenta")
+    table.add_column("Başlık", style="green")
+    table.add_column("Üye Sayısı", style="yellow")
+    
+    for i, g in enumerate(groups, 1):
+        members = str(g['members']) if g['members'] else "-"
+        table.add_row(str(i), g['type'], g['title'], members)
+    return table
+
+
+def build_selection_table(groups: list[dict], selected_groups: list[dict]) -> Table:
+    selected_ids = {g['id'] for g in selected_groups}
+    
+    table = Table(title="Gruplar")
+    table.add_column("Seçili", style="bold green")
+    table.add_column("No", style="cyan")
+    table.add_column("Başlık")
+    
+    for i, g in enumerate(groups, 1):
+        selected = "[green]✓[/green]" if g['id'] in selected_ids else " "
+        table.add_row(selected, str(i), g['title'])
+    return table
+
+
 class TelegramBulkSender:
     
     def __init__(self):
@@ -26,6 +57,12 @@ class TelegramBulkSender:
         self.group_manager: Optional[GroupManager] = None
         self.message_sender: Optional[MessageSender] = None
         self.selected_groups: list[dict] = []
+        self.stats_store = SendStatsStore()
+        self.settings = SenderSettings()
+        self.settings.last_sent.update(self.stats_store.last_sent_times())
+        self.resolve_cache = ResolveCache()
+        self.background_job: Optional[SendJob] = None
+        self._next_job_id = 1
     
     def print_header(self):
         console.print(Panel.fit(
@@ -43,6 +80,7 @@ class TelegramBulkSender:
         table.add_row("2", "👥 Grup Yönetimi")
         table.add_row("3", "📤 Mesaj Gönder")
         table.add_row("4", "⚙️  Ayarlar")
+        table.add_row("5", "📊 Gönderim İstatistikleri")
         table.add_row("0", "🚪 Çıkış")
         
         console.print(Panel(table, title="[bold]Menü[/bold]", border_style="green"))
@@ -81,6 +119,9 @@ class TelegramBulkSender:
         table.add_row("1", "📝 Tek Seferlik Gönder")
         table.add_row("2", "🔄 Döngü Modunda Gönder")
         table.add_row("3", "🖼️  Resimli Mesaj Gönder")
+        table.add_row("4", "🧮 Süre Planı (Dry-Run)")
+        table.add_row("5", "📈 Arka Plan Gönderim Durumu")
+        table.add_row("6", "⏹️  Arka Plan Gönderimini Durdur")
         table.add_row("0", "⬅️  Geri")
         
         console.print(Panel(table, title="[bold]Mesaj Gönder[/bold]", border_style="yellow"))
@@ -90,8 +131,15 @@ class TelegramBulkSender:
         if self.message_sender:
             settings_text = (
                 f"[dim]Grup arası bekleme: {self.message_sender.group_delay} sn[/dim]\n"
-                f"[dim]Döngü arası bekleme: {self.message_sender.loop_delay} sn[/dim]\n\n"
+                f"[dim]Döngü arası bekleme: {self.message_sender.loop_delay} sn[/dim]\n"
+                f"[dim]Aynı gruba tekrar gönderim aralığı: {self.message_sender.message_delay} sn[/dim]\n"
+                f"[dim]Grup tipi / grup özel ayar: {len(self.settings.data['group_types'])} / "
+                f"{len(self.settings.data['groups'])}[/dim]\n"
+                f"[dim]Gönderim modu: {self.settings.get('dispatch_mode')}[/dim]\n"
+                f"[dim]Ayar dosyası: {self.settings.path}[/dim]\n\n"
             )
+            if self.settings.error:
+                settings_text += f"[red]{self.settings.error}[/red]\n\n"
         
         table = Table(show_header=False, box=None)
         table.add_column("Seçenek", style="cyan")
@@ -99,6 +147,11 @@ class TelegramBulkSender:
         
         table.add_row("1", "⏱️  Grup Arası Bekleme Süresi")
         table.add_row("2", "🔄 Döngü Arası Bekleme Süresi")
+        table.add_row("3", "📨 Aynı Gruba Tekrar Gönderim Aralığı")
+        table.add_row("4", "🏷️  Grup Tipine Özel Bekleme")
+        table.add_row("5", "🎯 Seçili Gruplara Özel Bekleme")
+        table.add_row("6", "♻️  Ayar Dosyasını Yeniden Yükle")
+        table.add_row("7", "📡 Gönderim Modu (direct / forward / copy)")
         table.add_row("0", "⬅️  Geri")
         
         console.print(Panel(settings_text + "Ayarlar:", title="[bold]Ayarlar[/bold]", border_style="white"))
@@ -126,13 +179,13 @@ class TelegramBulkSender:
     async def handle_account_menu(self):
         while True:
             self.print_account_menu()
-            choice = Prompt.ask("Seçim", choices=["1", "2", "3", "4", "0"])
+            choice = await async_prompt.ask("Seçim", choices=["1", "2", "3", "4", "0"])
             
             if choice == "1":
-                phone = Prompt.ask("📱 Telefon numarası (+90...)")
+                phone = await async_prompt.ask("📱 Telefon numarası (+90...)")
                 if phone:
-                    with console.status("[bold green]Giriş yapılıyor..."):
-                        success, msg = await self.session_manager.login(phone)
+                    console.print("[bold green]Giriş yapılıyor...[/bold green]")
+                    success, msg = await self.session_manager.login(phone)
                     if success:
                         console.print(f"[bold green]✅ {msg}[/bold green]")
                         self._init_managers()
@@ -153,7 +206,7 @@ class TelegramBulkSender:
                     table.add_row(str(i), session)
                 console.print(table)
                 
-                idx = IntPrompt.ask("Hesap seçin (numara)", default=0) - 1
+                idx = await async_prompt.ask_int("Hesap seçin (numara)", default=0) - 1
                 if 0 <= idx < len(sessions):
                     with console.status("[bold green]Hesap yükleniyor..."):
                         success, msg = await self.session_manager.load_session(sessions[idx])
@@ -194,9 +247,9 @@ class TelegramBulkSender:
                     table.add_row(str(i), session)
                 console.print(table)
                 
-                idx = IntPrompt.ask("Hesap seçin (numara)", default=0) - 1
+                idx = await async_prompt.ask_int("Hesap seçin (numara)", default=0) - 1
                 if 0 <= idx < len(sessions):
-                    if Confirm.ask(f"[bold red]{sessions[idx]} hesabını silmek istediğinize emin misiniz?[/bold red]"):
+                    if await async_prompt.confirm(f"[bold red]{sessions[idx]} hesabını silmek istediğinize emin misiniz?[/bold red]"):
                         success, msg = await self.session_manager.logout(sessions[idx])
                         if success:
                             console.print(f"[bold green]✅ {msg}[/bold green]")
@@ -211,8 +264,25 @@ class TelegramBulkSender:
     def _init_managers(self):
         client = self.session_manager.get_active_client()
         if client:
-            self.group_manager = GroupManager(client)
-            self.message_sender = MessageSender(client)
+            self.group_manager = GroupManager(
+                client,
+                account=self.session_manager.get_active_phone(),
+                resolve_cache=self.resolve_cache
+            )
+            self.message_sender = self._create_sender()
+    
+    def _create_sender(self) -> MessageSender:
+        phone = self.session_manager.get_active_phone()
+        return MessageSender(
+            self.session_manager.get_active_client(),
+            account=phone,
+            stats_store=self.stats_store,
+            settings=self.settings,
+            connection=self.session_manager.get_monitor(phone)
+        )
+    
+    def _background_running(self) -> bool:
+        return self.background_job is not None and self.background_job.is_active()
     
     async def handle_group_menu(self):
         if not await self.check_login():
@@ -220,28 +290,19 @@ class TelegramBulkSender:
         
         while True:
             self.print_group_menu()
-            choice = Prompt.ask("Seçim", choices=["1", "2", "3", "4", "0"])
+            choice = await async_prompt.ask("Seçim", choices=["1", "2", "3", "4", "0"])
             
             if choice == "1":
                 with console.status("[bold green]Gruplar yükleniyor..."):
                     groups = await self.group_manager.fetch_groups()
                 
                 if groups:
-                    table = Table(title=f"Gruplarınız ({len(groups)} adet)")
-                    table.add_column("No", style="cyan")
-                    table.add_column("Tip", style="magenta")
-                    table.add_column("Başlık", style="green")
-                    table.add_column("Üye Sayısı", style="yellow")
-                    
-                    for i, g in enumerate(groups, 1):
-                        members = str(g['members']) if g['members'] else "-"
-                        table.add_row(str(i), g['type'], g['title'], members)
-                    console.print(table)
+                    console.print(build_group_table(groups))
                 else:
                     console.print("[yellow]📭 Hiç grup bulunamadı.[/yellow]")
             
             elif choice == "2":
-                link = Prompt.ask("🔗 Grup linki veya username")
+                link = await async_prompt.ask("🔗 Grup linki veya username")
                 if link:
                     with console.status("[bold green]Gruba katılınıyor..."):
                         success, msg = await self.group_manager.join_group(link)
@@ -256,38 +317,24 @@ class TelegramBulkSender:
                     console.print("[yellow]⚠️  Önce grupları listeleyin (seçenek 1).[/yellow]")
                     continue
                 
-                table = Table(title="Gruplar")
-                table.add_column("Seçili", style="bold green")
-                table.add_column("No", style="cyan")
-                table.add_column("Başlık")
-                
-                for i, g in enumerate(groups, 1):
-                    selected = "[green]✓[/green]" if g in self.selected_groups else " "
-                    table.add_row(selected, str(i), g['title'])
-                console.print(table)
+                console.print(build_selection_table(groups, self.selected_groups))
                 
                 console.print("[dim]Birden fazla grup seçmek için virgülle ayırın (örn: 1,3,5)[/dim]")
                 console.print("[dim]'all' yazarak tümünü seçebilirsiniz[/dim]")
                 console.print("[dim]'clear' yazarak seçimi temizleyebilirsiniz[/dim]")
                 
-                selection = Prompt.ask("Seçim").lower()
+                selection = (await async_prompt.ask("Seçim")).lower()
+                
+                try:
+                    self.selected_groups = self.group_manager.select_groups(selection, groups)
+                except ValueError:
+                    console.print("[red]❌ Geçersiz format.[/red]")
+                    continue
                 
-                if selection == "all":
-                    self.selected_groups = groups.copy()
-                    console.print(f"[bold green]✅ {len(groups)} grup seçildi.[/bold green]")
-                elif selection == "clear":
-                    self.selected_groups = []
+                if selection.strip() == "clear":
                     console.print("[bold green]✅ Seçim temizlendi.[/bold green]")
                 else:
-                    try:
-                        indices = [int(x.strip()) - 1 for x in selection.split(",")]
-                        self.selected_groups = []
-                        for idx in indices:
-                            if 0 <= idx < len(groups):
-                                self.selected_groups.append(groups[idx])
-                        console.print(f"[bold green]✅ {len(self.selected_groups)} grup seçildi.[/bold green]")
-                    except ValueError:
-                        console.print("[red]❌ Geçersiz format.[/red]")
+                    console.print(f"[bold green]✅ {len(self.selected_groups)} grup seçildi.[/bold green]")
             
             elif choice == "4":
                 if self.selected_groups:
@@ -308,7 +355,7 @@ class TelegramBulkSender:
         if not await self.check_login():
             return
         
-        if not self.selected_groups:
+        if not self.selected_groups and not self.background_job:
             console.print("[bold yellow]⚠️  Önce hedef grupları seçmelisiniz![/bold yellow]")
             console.print("   Grup Yönetimi > Hedef Grupları Seç")
             return
@@ -316,7 +363,21 @@ class TelegramBulkSender:
         while True:
             self.print_message_menu()
             console.print(f"[dim]📊 Seçili grup: {len(self.selected_groups)} adet[/dim]")
-            choice = Prompt.ask("Seçim", choices=["1", "2", "3", "0"])
+            if self._background_running():
+                progress = self.background_job.progress
+                console.print(
+                    f"[dim]🔄 Arka planda gönderim sürüyor: döngü #{progress['loop_count']}, "
+                    f"{progress['success']} başarılı / {progress['failed']} başarısız[/dim]"
+                )
+            choice = await async_prompt.ask("Seçim", choices=["1", "2", "3", "4", "5", "6", "0"])
+            
+            if choice in ("1", "2", "3") and self._background_running():
+                console.print("[yellow]⚠️  Arka planda bir gönderim zaten çalışıyor, önce durdurun.[/yellow]")
+                continue
+            
+            if choice in ("1", "2", "3", "4") and not self.selected_groups:
+                console.print("[yellow]⚠️  Önce hedef grupları seçmelisiniz.[/yellow]")
+                continue
             
             if choice == "1":
                 await self._send_messages(loop=False, with_image=False)
@@ -327,11 +388,24 @@ class TelegramBulkSender:
             elif choice == "3":
                 await self._send_messages(loop=False, with_image=True)
             
+            elif choice == "4":
+                await self._plan_messages()
+            
+            elif choice == "5":
+                self.show_background_status()
+            
+            elif choice == "6":
+                if self._background_running():
+                    self.background_job.cancel()
+                    console.print("[bold yellow]⏹️  Arka plan gönderimi durduruluyor...[/bold yellow]")
+                else:
+                    console.print("[yellow]📭 Çalışan arka plan gönderimi yok.[/yellow]")
+            
             elif choice == "0":
                 break
     
     async def _send_messages(self, loop: bool = False, with_image: bool = False):
-        message = Prompt.ask("\n📝 Mesajınızı girin (Premium emoji desteklenir)")
+        message = await async_prompt.ask("\n📝 Mesajınızı girin (Premium emoji desteklenir)")
         
         if not message:
             console.print("[red]❌ Mesaj boş olamaz.[/red]")
@@ -339,20 +413,35 @@ class TelegramBulkSender:
         
         image_path = None
         if with_image:
-            image_path = Prompt.ask("\n🖼️  Resim yolu (örn: /path/to/image.jpg)")
+            image_path = await async_prompt.ask("\n🖼️  Resim yolu (örn: /path/to/image.jpg)")
             if not image_path:
                 console.print("[yellow]⚠️  Resim yolu belirtilmedi, sadece metin gönderilecek.[/yellow]")
                 image_path = None
         
         if loop:
-            console.print("[bold yellow]🔄 Döngü modu aktif. Durdurmak için Ctrl+C kullanın.[/bold yellow]")
+            console.print("[bold yellow]🔄 Döngü modu arka planda çalışır, menüyü kullanmaya devam edebilirsiniz.[/bold yellow]")
             console.print(f"   Grup arası bekleme: {self.message_sender.group_delay} sn")
             console.print(f"   Döngü arası bekleme: {self.message_sender.loop_delay} sn")
         
-        if not Confirm.ask("\n▶️  Gönderimi başlatmak istiyor musunuz?"):
+        if not await async_prompt.confirm("\n▶️  Gönderimi başlatmak istiyor musunuz?"):
             console.print("[red]❌ Gönderim iptal edildi.[/red]")
             return
         
+        if loop:
+            self.background_job = SendJob(
+                self._next_job_id,
+                self.session_manager.get_active_phone(),
+                self._create_sender(),
+                list(self.selected_groups),
+                message,
+                image_path,
+                loop=True
+            )
+            self._next_job_id += 1
+            self.background_job.start()
+            console.print("[bold green]✅ Döngü gönderimi arka planda başladı. Durum: Mesaj Gönder > 5[/bold green]")
+            return
+        
         console.print(Panel("📤 GÖNDERIM BAŞLIYOR", style="bold green"))
         
         progress = Progress(
@@ -368,6 +457,9 @@ class TelegramBulkSender:
                 task_id = progress.add_task("[cyan]Mesajlar gönderiliyor...", total=len(self.selected_groups))
                 
                 def progress_callback(title, success, msg):
+                    if success is None:
+                        progress.update(task_id, description=f"[cyan]{msg.strip()}")
+                        return
                     if success:
                         console.print(f"[green]✓ {title}[/green]")
                     else:
@@ -382,33 +474,118 @@ class TelegramBulkSender:
                     callback=progress_callback
                 )
             
-            table = Table(title="Sonuçlar", show_header=True)
-            table.add_column("Durum", style="bold")
-            table.add_column("Sayı")
-            
-            table.add_row("✅ Başarılı", str(results['success']), style="green")
-            table.add_row("❌ Başarısız", str(results['failed']), style="red")
-            table.add_row("📊 Toplam", str(results['total']), style="blue")
-            if loop:
-                table.add_row("🔄 Döngü sayısı", str(results['loop_count']), style="yellow")
-            
-            console.print(table)
+            self.print_results(results, loop)
             
         except KeyboardInterrupt:
             self.message_sender.stop()
             console.print("\n\n[bold red]⚠️  Gönderim kullanıcı tarafından durduruldu.[/bold red]")
     
+    def print_results(self, results: dict, loop: bool = False):
+        table = Table(title="Sonuçlar", show_header=True)
+        table.add_column("Durum", style="bold")
+        table.add_column("Sayı")
+        
+        table.add_row("✅ Başarılı", str(results['success']), style="green")
+        table.add_row("❌ Başarısız", str(results['failed']), style="red")
+        table.add_row("📊 Toplam", str(results['total']), style="blue")
+        if loop:
+            table.add_row("🔄 Döngü sayısı", str(results['loop_count']), style="yellow")
+        if results.get('drops') or results.get('reconnects'):
+            table.add_row("📉 Bağlantı kopması", str(results.get('drops', 0)), style="magenta")
+            table.add_row("🔌 Yeniden bağlanma", str(results['reconnects']), style="magenta")
+            table.add_row("⏸️  Bağlantısız süre", self._format_duration(results['downtime']), style="magenta")
+        if results.get('dispatch_mode', "direct") != "direct":
+            table.add_row("📡 Gönderim modu", results['dispatch_mode'], style="cyan")
+        if results.get('resent'):
+            table.add_row("🔁 Yeniden gönderilen", str(results['resent']), style="magenta")
+        
+        console.print(table)
+    
+    def show_background_status(self):
+        job = self.background_job
+        if not job:
+            console.print("[yellow]📭 Arka plan gönderimi başlatılmadı.[/yellow]")
+            return
+        
+        console.print(Panel(
+            "\n".join(job.log) or "-",
+            title=f"[bold]Görev #{job.id} — {job.status}[/bold]",
+            border_style="cyan"
+        ))
+        self.print_results(job.progress, loop=job.loop)
+    
+    async def _plan_messages(self):
+        loop = await async_prompt.confirm("🔄 Döngü modu planlansın mı?", default=True)
+        image_path = await async_prompt.ask("🖼️  Resim yolu (boş bırakılabilir)", default="") or None
+        
+        plan = await self.message_sender.send_to_groups(
+            self.selected_groups,
+            "",
+            image_path,
+            loop=loop,
+            dry_run=True
+        )
+        
+        table = Table(title=f"Tur Planı (gönderim başı ~{plan['send_cost']:.1f} sn)")
+        table.add_column("Tur", style="cyan")
+        table.add_column("Gönderim")
+        table.add_column("Tur Süresi", style="green")
+        table.add_column("Sonraki Tura Kadar", style="yellow")
+        table.add_column("Yavaş Mod Beklemesi", style="red")
+        
+        for p in plan["passes"]:
+            table.add_row(
+                str(p["index"]),
+                str(p["sends"]),
+                self._format_duration(p["duration"]),
+                self._format_duration(p["cycle"]),
+                self._format_duration(p["throttled"])
+            )
+        console.print(table)
+        console.print(
+            f"[bold]⏱️  İlk tur: {self._format_duration(plan['pass_eta'])} | "
+            f"📈 Saatte ~{plan['sends_per_hour']:.0f} gönderim | 📡 Mod: {plan['dispatch_mode']}[/bold]"
+        )
+        
+        table = Table(title="Hızı Sınırlayan Gruplar")
+        table.add_column("Başlık", style="green")
+        table.add_column("Grup Arası", style="cyan")
+        table.add_column("Tekrar Aralığı", style="cyan")
+        table.add_column("Ort. Bekleme", style="red")
+        
+        for g in plan["bottlenecks"]:
+            table.add_row(
+                g["title"],
+                f"{g['group_delay']} sn",
+                f"{g['message_delay']} sn",
+                self._format_duration(g["throttled"])
+            )
+        console.print(table)
+        
+        for g in plan["slowmode_warnings"]:
+            console.print(f"[yellow]⚠️  {g['title']}: yavaş mod açık, özel tekrar aralığı tanımlı değil.[/yellow]")
+    
+    def _format_duration(self, seconds: float) -> str:
+        minutes, secs = divmod(int(round(seconds)), 60)
+        hours, minutes = divmod(minutes, 60)
+        if hours:
+            return f"{hours} sa {minutes} dk"
+        if minutes:
+            return f"{minutes} dk {secs} sn"
+        return f"{secs} sn"
+    
     async def handle_settings_menu(self):
         if not self.message_sender:
             print("\n⚠️  Önce bir hesaba giriş yapmalısınız!")
             return
         
         while True:
+            self.settings.reload()
             self.print_settings_menu()
-            choice = Prompt.ask("Seçim", choices=["1", "2", "0"])
+            choice = await async_prompt.ask("Seçim", choices=["1", "2", "3", "4", "5", "6", "7", "0"])
             
             if choice == "1":
-                delay = IntPrompt.ask("⏱️  Grup arası bekleme süresi (saniye)")
+                delay = await async_prompt.ask_int("⏱️  Grup arası bekleme süresi (saniye)")
                 if delay >= 0:
                     self.message_sender.set_delays(group_delay=delay)
                     console.print(f"[bold green]✅ Grup arası bekleme: {delay} saniye olarak ayarlandı.[/bold green]")
@@ -416,16 +593,125 @@ class TelegramBulkSender:
                     console.print("[red]❌ Süre 0 veya daha büyük olmalı.[/red]")
             
             elif choice == "2":
-                delay = IntPrompt.ask("🔄 Döngü arası bekleme süresi (saniye)")
+                delay = await async_prompt.ask_int("🔄 Döngü arası bekleme süresi (saniye)")
                 if delay >= 0:
                     self.message_sender.set_delays(loop_delay=delay)
                     console.print(f"[bold green]✅ Döngü arası bekleme: {delay} saniye olarak ayarlandı.[/bold green]")
                 else:
                     console.print("[red]❌ Süre 0 veya daha büyük olmalı.[/red]")
             
+            elif choice == "3":
+                delay = await async_prompt.ask_int("📨 Aynı gruba iki gönderim arasındaki en az süre (saniye)")
+                if delay >= 0:
+                    self.message_sender.set_delays(message_delay=delay)
+                    console.print(f"[bold green]✅ Tekrar gönderim aralığı: {delay} saniye olarak ayarlandı.[/bold green]")
+                else:
+                    console.print("[red]❌ Süre 0 veya daha büyük olmalı.[/red]")
+            
+            elif choice == "4":
+                group_type = await async_prompt.ask("🏷️  Grup tipi", choices=list(GROUP_TYPES))
+                delays = await self._ask_override_delays()
+                if delays is None:
+                    self.settings.clear_override("group_types", group_type)
+                    console.print(f"[bold green]✅ {group_type} için özel ayar kaldırıldı.[/bold green]")
+                elif delays:
+                    self.settings.set_override("group_types", group_type, **delays)
+                    console.print(f"[bold green]✅ {group_type} için özel bekleme kaydedildi.[/bold green]")
+            
+            elif choice == "5":
+                if not self.selected_groups:
+                    console.print("[yellow]⚠️  Önce hedef grupları seçmelisiniz.[/yellow]")
+                    continue
+                
+                delays = await self._ask_override_delays()
+                for group in self.selected_groups:
+                    if delays is None:
+                        self.settings.clear_override("groups", group["id"])
+                    elif delays:
+                        self.settings.set_override("groups", group["id"], **delays)
+                if delays is None or delays:
+                    console.print(f"[bold green]✅ {len(self.selected_groups)} grup için ayar güncellendi.[/bold green]")
+            
+            elif choice == "6":
+                self.settings.reload(force=True)
+                if self.settings.error:
+                    console.print(f"[red]❌ {self.settings.error}[/red]")
+                else:
+                    console.print("[bold green]✅ Ayarlar yeniden yüklendi.[/bold green]")
+            
+            elif choice == "7":
+                console.print("[dim]direct: her gruba ayrı yükleme | forward: bir kez Kayıtlı Mesajlar'a gönderip iletir | copy: forward gibi, 'iletildi' etiketi olmadan[/dim]")
+                mode = await async_prompt.ask("📡 Gönderim modu", choices=list(DISPATCH_MODES), default=self.settings.get("dispatch_mode"))
+                self.settings.set_dispatch_mode(mode)
+                console.print(f"[bold green]✅ Gönderim modu: {mode}[/bold green]")
+            
             elif choice == "0":
                 break
     
+    async def _ask_override_delays(self) -> Optional[dict]:
+        console.print("[dim]Boş bırakılan değer değiştirilmez, -1 özel ayarı tamamen kaldırır.[/dim]")
+        delays = {}
+        for key, label in (("group_delay", "⏱️  Grup arası bekleme"), ("message_delay", "📨 Tekrar gönderim aralığı")):
+            value = await async_prompt.ask(f"{label} (saniye)", default="")
+            if not value:
+                continue
+            try:
+                delay = int(value)
+            except ValueError:
+                console.print("[red]❌ Geçersiz sayı.[/red]")
+                return {}
+            if delay < 0:
+                return None
+            delays[key] = delay
+        return delays
+    
+    async def show_stats_report(self):
+        total = self.stats_store.total_attempts()
+        if not total:
+            console.print("[yellow]📭 Henüz kayıtlı gönderim yok.[/yellow]")
+            return
+        
+        limit = await async_prompt.ask_int("Gösterilecek grup sayısı", default=20)
+        
+        table = Table(title=f"Grup Bazlı Başarı (en düşükten, toplam {total} deneme)")
+        table.add_column("Chat ID", style="cyan")
+        table.add_column("Başlık", style="green")
+        table.add_column("Deneme", style="blue")
+        table.add_column("Başarı %", style="bold")
+        table.add_column("Ort. Gecikme (ms)", style="yellow")
+        
+        for row in self.stats_store.chat_report(limit=limit):
+            rate = row['success_rate'] * 100
+            style = "red" if rate < 50 else "green"
+            table.add_row(
+                str(row['chat_id']),
+                row['title'] or "-",
+                str(row['attempts']),
+                f"[{style}]{rate:.1f}[/{style}]",
+                f"{row['avg_latency_ms']:.0f}"
+            )
+        console.print(table)
+        
+        errors = self.stats_store.error_breakdown()
+        if errors:
+            table = Table(title="Hata Dağılımı")
+            table.add_column("Hata", style="red")
+            table.add_column("Deneme")
+            table.add_column("Etkilenen Grup")
+            
+            for row in errors:
+                table.add_row(row['outcome'], str(row['attempts']), str(row['chats']))
+            console.print(table)
+        
+        percentiles = self.stats_store.latency_percentiles()
+        table = Table(title="Gönderim Gecikmesi (ms)")
+        table.add_column("Yüzdelik", style="cyan")
+        table.add_column("Süre", style="yellow")
+        
+        for p, value in percentiles.items():
+            table.add_row(f"p{int(p * 100)}", str(value) if value is not None else "-")
+        console.print(table)
+    
     async def run(self):
         if not await self.check_credentials():
             return
@@ -446,7 +732,7 @@ class TelegramBulkSender:
                 if active:
                     console.print(f"[bold green]👤 Aktif: {active}[/bold green]")
                 
-                choice = Prompt.ask("Seçim", choices=["1", "2", "3", "4", "0"])
+                choice = await async_prompt.ask("Seçim", choices=["1", "2", "3", "4", "5", "0"])
                 
                 if choice == "1":
                     await self.handle_account_menu()
@@ -456,16 +742,27 @@ class TelegramBulkSender:
                     await self.handle_message_menu()
                 elif choice == "4":
                     await self.handle_settings_menu()
+                elif choice == "5":
+                    await self.show_stats_report()
                 elif choice == "0":
                     break
         
         finally:
             console.print("[bold blue]👋 Çıkış yapılıyor...[/bold blue]")
+            if self._background_running():
+                self.background_job.cancel()
+                await asyncio.gather(self.background_job.task, return_exceptions=True)
             await self.session_manager.disconnect_all()
+            self.stats_store.close()
+            self.resolve_cache.close()
             console.print("[bold green]✅ Güle güle![/bold green]")
 
 
 def main():
+    if "--profile" in sys.argv or config.PROFILE_ENABLED:
+        import profiling
+        console.print(f"[bold magenta]🔬 {profiling.install()}[/bold magenta]")
+    
     app = TelegramBulkSender()
     
     def signal_handler(sig, frame):
@@ -1,19 +1,73 @@
 import asyncio
+import math
+import time
 from pathlib import Path
 from typing import Optional
 from telethon import TelegramClient
 from telethon.tl.types import Channel, Chat
 import config
+from send_stats import SendStatsStore
+from sender_settings import SenderSettings
+from connection_monitor import ConnectionMonitor
+
+
+ERROR_OUTCOMES = {
+    "FloodWaitError": "flood_wait",
+    "ChatWriteForbiddenError": "write_forbidden",
+    "UserBannedInChannelError": "banned",
+    "SlowModeWaitError": "slow_mode",
+}
+
+FORWARD_FALLBACK_ERRORS = {
+    "ChatForwardsRestrictedError",
+    "MessageIdInvalidError",
+}
+
+
+class SystemClock:
+    
+    def now(self) -> float:
+        return time.monotonic()
+    
+    def wall(self) -> float:
+        return time.time()
+    
+    async def sleep(self, seconds: float):
+        await asyncio.sleep(seconds)
 
 
 class MessageSender:
     
-    def __init__(self, client: TelegramClient):
+    def __init__(
+        self,
+        client: TelegramClient,
+        account: Optional[str] = None,
+        stats_store: Optional[SendStatsStore] = None,
+        settings: Optional[SenderSettings] = None,
+        clock: Optional[SystemClock] = None,
+        connection: Optional[ConnectionMonitor] = None
+    ):
         self.client = client
+        self.account = account or ""
+        self.stats_store = stats_store
+        self.settings = settings or SenderSettings()
+        self.clock = clock or SystemClock()
+        self.connection = connection
         self.is_running = False
-        self.message_delay = config.DEFAULT_MESSAGE_DELAY
-        self.group_delay = config.DEFAULT_GROUP_DELAY
-        self.loop_delay = config.DEFAULT_LOOP_DELAY
+        self.loop_count = 0
+        self.last_sent = self.settings.last_sent
+    
+    @property
+    def message_delay(self) -> float:
+        return self.settings.get("message_delay")
+    
+    @property
+    def group_delay(self) -> float:
+        return self.settings.get("group_delay")
+    
+    @property
+    def loop_delay(self) -> float:
+        return self.settings.get("loop_delay")
     
     def set_delays(
         self,
@@ -21,12 +75,26 @@ class MessageSender:
         group_delay: Optional[int] = None,
         loop_delay: Optional[int] = None
     ):
+        delays = {}
         if message_delay is not None:
-            self.message_delay = message_delay
+            delays["message_delay"] = message_delay
         if group_delay is not None:
-            self.group_delay = group_delay
+            delays["group_delay"] = group_delay
         if loop_delay is not None:
-            self.loop_delay = loop_delay
+            delays["loop_delay"] = loop_delay
+        self.settings.set_defaults(**delays)
+    
+    async def _wait(self, key: str, group: Optional[dict] = None, since: Optional[float] = None):
+        started = self.clock.now() if since is None else since
+        
+        while self.is_running:
+            remaining = started + self.settings.get(key, group) - self.clock.now()
+            if remaining <= 0:
+                await self.clock.sleep(0)
+                break
+            
+            await self.clock.sleep(min(remaining, config.SETTINGS_RELOAD_INTERVAL))
+            self.settings.reload()
     
     async def send_message(
         self,
@@ -34,11 +102,25 @@ class MessageSender:
         message: str,
         image_path: Optional[str] = None
     ) -> tuple[bool, str]:
+        success, msg, _ = await self._dispatch(entity, message, image_path)
+        return success, msg
+    
+    async def _dispatch(
+        self,
+        entity,
+        message: str,
+        image_path: Optional[str] = None,
+        forward_source=None,
+        drop_author: bool = False
+    ) -> tuple[bool, str, str]:
         try:
+            if forward_source is not None and await self._try_forward(entity, forward_source, drop_author):
+                return True, "Mesaj iletildi!", "ok"
+            
             if image_path:
                 path = Path(image_path)
                 if not path.exists():
-                    return False, f"Resim bulunamadı: {image_path}"
+                    return False, f"Resim bulunamadı: {image_path}", "missing_media"
                 
                 await self.client.send_file(
                     entity,
@@ -48,19 +130,96 @@ class MessageSender:
             else:
                 await self.client.send_message(entity, message)
             
-            return True, "Mesaj gönderildi!"
+            return True, "Mesaj gönderildi!", "ok"
             
         except Exception as e:
             error_msg = str(e)
-            if "FloodWaitError" in error_msg:
-                return False, f"Flood bekleme hatası: {error_msg}"
-            elif "ChatWriteForbiddenError" in error_msg:
-                return False, "Bu gruba mesaj gönderme izniniz yok."
-            elif "UserBannedInChannelError" in error_msg:
-                return False, "Bu gruptan banlandınız."
-            elif "SlowModeWaitError" in error_msg:
-                return False, "Yavaş mod aktif, beklemeniz gerekiyor."
-            return False, f"Mesaj hatası: {error_msg}"
+            outcome = ERROR_OUTCOMES.get(type(e).__name__, "error")
+            if isinstance(e, (ConnectionError, asyncio.TimeoutError)):
+                return False, f"Bağlantı hatası: {error_msg}", "disconnected"
+            if outcome == "flood_wait":
+                return False, f"Flood bekleme hatası: {error_msg}", outcome
+            elif outcome == "write_forbidden":
+                return False, "Bu gruba mesaj gönderme izniniz yok.", outcome
+            elif outcome == "banned":
+                return False, "Bu gruptan banlandınız.", outcome
+            elif outcome == "slow_mode":
+                return False, "Yavaş mod aktif, beklemeniz gerekiyor.", outcome
+            return False, f"Mesaj hatası: {error_msg}", outcome
+    
+    async def _try_forward(self, entity, forward_source, drop_author: bool) -> bool:
+        try:
+            await self.client.forward_messages(
+                entity,
+                forward_source,
+                drop_author=drop_author
+            )
+            return True
+        except Exception as e:
+            if type(e).__name__ in FORWARD_FALLBACK_ERRORS:
+                return False
+            raise
+    
+    async def _prepare_source(self, message: str, image_path: Optional[str] = None):
+        try:
+            if image_path:
+                path = Path(image_path)
+                if not path.exists():
+                    return None
+                return await self.client.send_file(config.FORWARD_SOURCE_CHAT, path, caption=message)
+            return await self.client.send_message(config.FORWARD_SOURCE_CHAT, message)
+        except Exception:
+            return None
+    
+    def _stored_text(self, message: str) -> str:
+        parser = getattr(self.client, "parse_mode", None)
+        if parser:
+            message = parser.parse(message)[0]
+        return message.strip()
+    
+    async def _was_delivered(
+        self,
+        entity,
+        message: str,
+        since: float,
+        group: Optional[dict] = None
+    ) -> Optional[bool]:
+        try:
+            expected = self._stored_text(message)
+            skew = min(config.DELIVERY_CLOCK_SKEW, self.settings.get("message_delay", group) / 2)
+            cutoff = since - skew
+            async for sent in self.client.iter_messages(entity, limit=config.DELIVERY_CHECK_LIMIT):
+                if sent.date.timestamp() < cutoff:
+                    break
+                if sent.out and (sent.message or "").strip() == expected:
+                    return True
+            return False
+        except Exception:
+            return None
+    
+    async def _recover_send(
+        self,
+        entity,
+        message: str,
+        image_path: Optional[str],
+        since: float,
+        group: Optional[dict] = None,
+        forward_source=None,
+        drop_author: bool = False
+    ) -> tuple[bool, str, str, bool]:
+        if not await self.connection.wait_connected(lambda: self.is_running):
+            return False, "Bağlantı yeniden kurulamadı.", "disconnected", False
+        
+        delivered = await self._was_delivered(entity, message, since, group)
+        if delivered:
+            return True, "Mesaj bağlantı kopmadan önce ulaşmış.", "ok", False
+        if delivered is None:
+            return False, "Bağlantı koptu, teslim durumu doğrulanamadı.", "disconnected", False
+        
+        success, msg, outcome = await self._dispatch(
+            entity, message, image_path, forward_source, drop_author
+        )
+        return success, msg, outcome, True
     
     async def send_to_groups(
         self,
@@ -68,14 +227,36 @@ class MessageSender:
         message: str,
         image_path: Optional[str] = None,
         loop: bool = False,
-        callback=None
+        callback=None,
+        max_loops: Optional[int] = None,
+        dry_run: bool = False,
+        dispatch_mode: Optional[str] = None
     ) -> dict:
+        if dry_run:
+            from planner import plan_campaign
+            return await plan_campaign(
+                self, groups, message, image_path, loop=loop, dispatch_mode=dispatch_mode
+            )
+        
         self.is_running = True
-        results = {"success": 0, "failed": 0, "total": 0, "loop_count": 0}
+        self.loop_count = 0
+        results = {"success": 0, "failed": 0, "total": 0, "loop_count": 0, "resent": 0}
+        
+        dispatch_mode = dispatch_mode or self.settings.get("dispatch_mode")
+        forward_source, drop_author = None, False
+        if dispatch_mode in ("forward", "copy"):
+            forward_source = await self._prepare_source(message, image_path)
+            drop_author = dispatch_mode == "copy"
+            if forward_source is None:
+                dispatch_mode = "direct"
+        results["dispatch_mode"] = dispatch_mode
+        attempts: list[dict] = []
+        connection_before = self.connection.stats() if self.connection else None
         
         try:
             while self.is_running:
                 results["loop_count"] += 1
+                self.loop_count = results["loop_count"]
                 
                 if callback:
                     callback(None, None, f"\n🔄 Döngü #{results['loop_count']} başlıyor...")
@@ -84,13 +265,63 @@ class MessageSender:
                     if not self.is_running:
                         break
                     
+                    self.settings.reload()
+                    
                     entity = group.get("entity")
                     title = group.get("title", "Bilinmeyen")
+                    chat_id = group.get("id", 0)
                     
-                    if callback:
-                        callback(title, None, f"📤 Gönderiliyor: {title}")
+                    throttle_started = self.clock.now()
+                    if chat_id in self.last_sent:
+                        since = throttle_started - (self.clock.wall() - self.last_sent[chat_id])
+                        remaining = since + self.settings.get("message_delay", group) - throttle_started
+                        if remaining > 0 and callback:
+                            callback(title, None, f"⏳ {title}: tekrar gönderim aralığı için {math.ceil(remaining)} saniye bekleniyor...")
+                        await self._wait("message_delay", group, since=since)
+                        if not self.is_running:
+                            break
+                    
+                    connection_lost = False
+                    if self.connection and not self.connection.is_connected():
+                        if callback:
+                            callback(title, None, "🔌 Bağlantı koptu, yeniden bağlanılıyor...")
+                        connection_lost = not await self.connection.wait_connected(lambda: self.is_running)
+                        if not self.is_running:
+                            break
                     
-                    success, msg = await self.send_message(entity, message, image_path)
+                    started = self.clock.now()
+                    if connection_lost:
+                        success, msg, outcome = False, "Bağlantı yeniden kurulamadı, tur sonlandırıldı.", "disconnected"
+                    else:
+                        if callback:
+                            callback(title, None, f"📤 Gönderiliyor: {title}")
+                        
+                        sent_at = time.time()
+                        success, msg, outcome = await self._dispatch(
+                            entity, message, image_path, forward_source, drop_author
+                        )
+                        
+                        if outcome == "disconnected" and self.connection:
+                            self.connection.mark_down()
+                            if callback:
+                                callback(title, None, "🔌 Gönderim sırasında bağlantı koptu, teslim kontrol ediliyor...")
+                            success, msg, outcome, resent = await self._recover_send(
+                                entity, message, image_path, sent_at, group, forward_source, drop_author
+                            )
+                            results["resent"] += int(resent)
+                            connection_lost = not self.connection.is_connected()
+                        self.last_sent[chat_id] = self.clock.wall()
+                    attempts.append({
+                        "ts": time.time(),
+                        "account": self.account,
+                        "chat_id": chat_id,
+                        "title": title,
+                        "outcome": outcome,
+                        "latency_ms": int((self.clock.now() - started) * 1000),
+                        "loop_index": results["loop_count"],
+                        "started_at": started,
+                        "throttled_s": started - throttle_started
+                    })
                     results["total"] += 1
                     
                     if success:
@@ -102,24 +333,45 @@ class MessageSender:
                         if callback:
                             callback(title, False, f"❌ {title}: {msg}")
                     
+                    if connection_lost:
+                        break
+                    
                     if i < len(groups) - 1 or loop:
-                        if self.is_running:
-                            await asyncio.sleep(self.group_delay)
+                        await self._wait("group_delay", group)
+                
+                self._record_attempts(attempts)
+                attempts = []
                 
                 if not loop:
                     break
                 
+                if max_loops is not None and results["loop_count"] >= max_loops:
+                    break
+                
                 if self.is_running:
                     if callback:
                         callback(None, None, f"⏳ Sonraki döngü için {self.loop_delay} saniye bekleniyor...")
-                    await asyncio.sleep(self.loop_delay)
+                    await self._wait("loop_delay")
         
         except asyncio.CancelledError:
             pass
         
+        finally:
+            self._record_attempts(attempts)
+        
+        if connection_before:
+            connection_after = self.connection.stats()
+            results["drops"] = connection_after["drops"] - connection_before["drops"]
+            results["reconnects"] = connection_after["reconnects"] - connection_before["reconnects"]
+            results["downtime"] = connection_after["downtime"] - connection_before["downtime"]
+        
         self.is_running = False
         return results
     
+    def _record_attempts(self, attempts: list[dict]):
+        if self.stats_store and attempts:
+            self.stats_store.record_batch(attempts)
+    
     def stop(self):
         self.is_running = False
     
@@ -0,0 +1,171 @@
+import asyncio
+import time
+from pathlib import Path
+from typing import Optional
+import config
+from message_sender import MessageSender
+
+
+class SimulatedClock:
+    
+    def __init__(self):
+        self.time = 0.0
+        self.started_at = time.time()
+    
+    def now(self) -> float:
+        return self.time
+    
+    def wall(self) -> float:
+        return self.started_at + self.time
+    
+    async def sleep(self, seconds: float):
+        self.time += max(0.0, seconds)
+        await asyncio.sleep(0)
+
+
+class PlanningSender(MessageSender):
+    
+    def __init__(self, sender: MessageSender, request_cost: float, upload_cost: float):
+        super().__init__(
+            None,
+            account=sender.account,
+            settings=sender.settings,
+            clock=SimulatedClock()
+        )
+        self.last_sent = dict(sender.last_sent)
+        self.request_cost = request_cost
+        self.upload_cost = upload_cost
+        self.attempts: list[dict] = []
+    
+    async def _dispatch(
+        self,
+        entity,
+        message: str,
+        image_path: Optional[str] = None,
+        forward_source=None,
+        drop_author: bool = False
+    ) -> tuple[bool, str, str]:
+        if forward_source is not None:
+            await self.clock.sleep(self.request_cost)
+        else:
+            await self.clock.sleep(self.request_cost + self.upload_cost)
+        return True, "Planlandı", "ok"
+    
+    async def _prepare_source(self, message: str, image_path: Optional[str] = None):
+        if image_path and not Path(image_path).exists():
+            return None
+        await self.clock.sleep(self.request_cost + self.upload_cost)
+        return object()
+    
+    def _record_attempts(self, attempts: list[dict]):
+        self.attempts.extend(attempts)
+
+
+def estimate_send_cost(sender: MessageSender, image_path: Optional[str] = None) -> tuple[float, float]:
+    request_cost = config.PLAN_SEND_LATENCY
+    if sender.stats_store and sender.stats_store.total_attempts():
+        median_ms = sender.stats_store.latency_percentiles((0.5,))[0.5]
+        if median_ms is not None:
+            request_cost = median_ms / 1000
+    
+    upload_cost = 0.0
+    if image_path:
+        path = Path(image_path)
+        if path.exists():
+            upload_cost = path.stat().st_size / config.PLAN_UPLOAD_BYTES_PER_SEC
+    
+    return request_cost, upload_cost
+
+
+async def plan_campaign(
+    sender: MessageSender,
+    groups: list[dict],
+    message: str,
+    image_path: Optional[str] = None,
+    loop: bool = False,
+    passes: Optional[int] = None,
+    dispatch_mode: Optional[str] = None
+) -> dict:
+    sender.settings.reload()
+    request_cost, upload_cost = estimate_send_cost(sender, image_path)
+    passes = passes or (config.PLAN_LOOP_PASSES if loop else 1)
+    
+    planning = PlanningSender(sender, request_cost, upload_cost)
+    results = await planning.send_to_groups(
+        groups,
+        message,
+        image_path,
+        loop=loop,
+        max_loops=passes + 1 if loop else 1,
+        dispatch_mode=dispatch_mode
+    )
+    
+    send_cost = request_cost
+    if results["dispatch_mode"] == "direct":
+        send_cost += upload_cost
+    
+    by_pass: dict[int, list[dict]] = {}
+    for attempt in planning.attempts:
+        by_pass.setdefault(attempt["loop_index"], []).append(attempt)
+    
+    pass_starts = [attempts[0]["started_at"] for attempts in by_pass.values()]
+    planned = [a for a in planning.attempts if a["loop_index"] <= passes]
+    by_pass = {index: attempts for index, attempts in by_pass.items() if index <= passes}
+    
+    pass_reports = []
+    for index, attempts in by_pass.items():
+        start = attempts[0]["started_at"]
+        next_start = pass_starts[index] if index < len(pass_starts) else planning.clock.now()
+        pass_reports.append({
+            "index": index,
+            "sends": len(attempts),
+            "duration": attempts[-1]["started_at"] + send_cost - start,
+            "cycle": next_start - start,
+            "throttled": sum(a["throttled_s"] for a in attempts)
+        })
+    
+    steady = pass_reports[-1] if pass_reports else None
+    cycle = steady["cycle"] if steady and loop else (steady["duration"] if steady else 0.0)
+    sends_per_hour = steady["sends"] / cycle * 3600 if steady and cycle > 0 else 0.0
+    
+    group_costs = []
+    for group in groups:
+        attempts = [a for a in planned if a["chat_id"] == group.get("id", 0)]
+        throttled = sum(a["throttled_s"] for a in attempts) / max(len(attempts), 1)
+        group_costs.append({
+            "id": group.get("id"),
+            "title": group.get("title", "Bilinmeyen"),
+            "group_delay": sender.settings.get("group_delay", group),
+            "message_delay": sender.settings.get("message_delay", group),
+            "throttled": throttled,
+            "cost": send_cost + sender.settings.get("group_delay", group) + throttled,
+            "slowmode": bool(getattr(group.get("entity"), "slowmode_enabled", False))
+        })
+    group_costs.sort(key=lambda g: g["cost"], reverse=True)
+    
+    default_message_delay = sender.settings.get("message_delay")
+    warnings = [
+        g for g in group_costs
+        if g["slowmode"] and g["message_delay"] == default_message_delay
+    ]
+    
+    return {
+        "dry_run": True,
+        "dispatch_mode": results["dispatch_mode"],
+        "send_cost": send_cost,
+        "passes": pass_reports,
+        "pass_eta": planned[0]["started_at"] + pass_reports[0]["duration"] if pass_reports else 0.0,
+        "sends_per_hour": sends_per_hour,
+        "bottlenecks": group_costs[:config.PLAN_TOP_BOTTLENECKS],
+        "slowmode_warnings": warnings,
+        "schedule": [
+            {
+                "loop_index": a["loop_index"],
+                "offset": a["started_at"],
+                "chat_id": a["chat_id"],
+                "title": a["title"],
+                "throttled": a["throttled_s"]
+            }
+            for a in planned
+        ]
+    }
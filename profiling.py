@@ -0,0 +1,184 @@
+import asyncio
+import contextvars
+import cProfile
+import functools
+import io
+import itertools
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+import config
+
+
+_current_session: contextvars.ContextVar[Optional["ProfileSession"]] = contextvars.ContextVar(
+    "profile_session", default=None
+)
+_profiler_owner: Optional["ProfileSession"] = None
+_session_ids = itertools.count(1)
+
+
+class StackSampler(threading.Thread):
+    
+    def __init__(self, thread_id: int, interval: float, root_frame=None):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.root_frame = root_frame
+        self.stacks: Counter[str] = Counter()
+        self._stop_event = threading.Event()
+    
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            
+            names = []
+            in_session = self.root_frame is None
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                if frame is self.root_frame:
+                    in_session = True
+                    break
+                frame = frame.f_back
+            
+            if in_session:
+                self.stacks[";".join(reversed(names))] += 1
+    
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+    
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+    
+    def top_functions(self, limit: int) -> list[tuple[str, int]]:
+        leaves: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return leaves.most_common(limit)
+
+
+class ProfileSession:
+    
+    def __init__(self, name: str, output_dir: Optional[Path] = None, root_frame=None):
+        self.name = name
+        self.output_dir = output_dir or config.PROFILE_DIR
+        self.profiler: Optional[cProfile.Profile] = None
+        self.profiler_busy_with: Optional[str] = None
+        self.sampler = StackSampler(threading.get_ident(), config.PROFILE_SAMPLE_INTERVAL, root_frame)
+        self.base = self.output_dir / f"{name}-{time.strftime('%Y%m%d-%H%M%S')}-{next(_session_ids)}"
+        self.started = 0.0
+        self.running = False
+    
+    def start(self):
+        global _profiler_owner
+        
+        self.started = time.perf_counter()
+        self.running = True
+        self.sampler.start()
+        
+        # cProfile can only be active once per thread; concurrent sessions
+        # (e.g. a menu fetch during a background loop) fall back to samples.
+        if _profiler_owner is None:
+            _profiler_owner = self
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        else:
+            self.profiler_busy_with = _profiler_owner.name
+    
+    def write(self) -> Path:
+        elapsed = time.perf_counter() - self.started
+        self.output_dir.mkdir(exist_ok=True)
+        
+        report = io.StringIO()
+        report.write(f"{self.name}: {elapsed:.3f} sn{'' if not self.running else ' (sürüyor)'}\n")
+        report.write(f"Kripto: {crypto_backend()}\n\n")
+        
+        if self.profiler:
+            self.profiler.disable()
+            self.profiler.dump_stats(str(self.base.with_suffix(".prof")))
+            stats = pstats.Stats(self.profiler, stream=report)
+            stats.sort_stats("cumulative").print_stats(30)
+            if self.running:
+                self.profiler.enable()
+        else:
+            report.write(
+                f"cProfile o sırada '{self.profiler_busy_with}' oturumunda kullanılıyordu; "
+                f"bu çağrı için yalnızca örnekleme verisi (.collapsed) yazıldı.\n\n"
+            )
+            report.write(f"En çok örneklenen fonksiyonlar ({sum(self.sampler.stacks.values())} örnek):\n")
+            for name, count in self.sampler.top_functions(30):
+                report.write(f"  {count:>6}  {name}\n")
+        
+        self.base.with_suffix(".collapsed").write_text(self.sampler.collapsed(), encoding="utf-8")
+        self.base.with_suffix(".txt").write_text(report.getvalue(), encoding="utf-8")
+        return self.base
+    
+    def stop(self) -> Path:
+        global _profiler_owner
+        
+        self.running = False
+        if self.profiler:
+            self.profiler.disable()
+        if _profiler_owner is self:
+            _profiler_owner = None
+        self.sampler.stop()
+        return self.write()
+
+
+async def _flush_periodically(session: ProfileSession):
+    while True:
+        await asyncio.sleep(config.PROFILE_FLUSH_INTERVAL)
+        session.write()
+
+
+def profiled(name: str, func):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        if _current_session.get() is not None:
+            return await func(*args, **kwargs)
+        
+        session = ProfileSession(name, root_frame=sys._getframe())
+        token = _current_session.set(session)
+        session.start()
+        flusher = asyncio.create_task(_flush_periodically(session))
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            flusher.cancel()
+            _current_session.reset(token)
+            session.stop()
+    
+    return wrapper
+
+
+def crypto_backend() -> str:
+    try:
+        from telethon.crypto import aes
+    except ImportError:
+        return "bilinmiyor (telethon yüklenemedi)"
+    
+    if getattr(aes, "cryptg", None) is not None:
+        return "cryptg (hızlandırılmış)"
+    if getattr(aes, "libssl", None) is not None and getattr(aes.libssl, "encrypt_ige", None):
+        return "libssl (OpenSSL)"
+    return "saf Python (yavaş, 'pip install cryptg' önerilir)"
+
+
+def install() -> str:
+    from group_manager import GroupManager
+    from message_sender import MessageSender
+    from session_manager import SessionManager
+    
+    MessageSender.send_to_groups = profiled("send_to_groups", MessageSender.send_to_groups)
+    GroupManager.fetch_groups = profiled("fetch_groups", GroupManager.fetch_groups)
+    SessionManager.load_session = profiled("load_session", SessionManager.load_session)
+    
+    return f"Profil modu aktif, çıktı: {config.PROFILE_DIR} | Kripto: {crypto_backend()}"
@@ -0,0 +1,83 @@
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+import config
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS resolve_cache (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    status TEXT NOT NULL,
+    data TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (kind, key)
+) WITHOUT ROWID;
+"""
+
+
+class ResolveCache:
+    
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = db_path or config.RESOLVE_CACHE_PATH
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+    
+    def get(self, kind: str, key: str) -> Optional[dict]:
+        row = self.conn.execute(
+            "SELECT status, data, expires_at FROM resolve_cache WHERE kind = ? AND key = ?",
+            (kind, key)
+        ).fetchone()
+        if not row:
+            return None
+        
+        status, data, expires_at = row
+        if expires_at < time.time():
+            with self.conn:
+                self.conn.execute(
+                    "DELETE FROM resolve_cache WHERE kind = ? AND key = ?",
+                    (kind, key)
+                )
+            return None
+        
+        entry = json.loads(data)
+        entry["status"] = status
+        return entry
+    
+    def put(self, kind: str, key: str, status: str, data: Optional[dict] = None, ttl: Optional[float] = None):
+        if ttl is None:
+            ttl = config.RESOLVE_TTL if status == "ok" else config.RESOLVE_NEGATIVE_TTL
+        
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO resolve_cache (kind, key, status, data, expires_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (kind, key) DO UPDATE SET
+                    status = excluded.status,
+                    data = excluded.data,
+                    expires_at = excluded.expires_at
+                """,
+                (kind, key, status, json.dumps(data or {}), time.time() + ttl)
+            )
+    
+    def invalidate(self, kind: str, key: str):
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM resolve_cache WHERE kind = ? AND key = ?",
+                (kind, key)
+            )
+    
+    def purge_expired(self) -> int:
+        with self.conn:
+            cursor = self.conn.execute(
+                "DELETE FROM resolve_cache WHERE expires_at < ?",
+                (time.time(),)
+            )
+        return cursor.rowcount
+    
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,97 @@
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+from message_sender import MessageSender
+
+
+class SendJob:
+    
+    def __init__(
+        self,
+        job_id: int,
+        account: str,
+        sender: MessageSender,
+        groups: list[dict],
+        message: str,
+        image_path: Optional[str] = None,
+        loop: bool = False,
+        dispatch_mode: Optional[str] = None
+    ):
+        self.id = job_id
+        self.account = account
+        self.sender = sender
+        self.groups = groups
+        self.message = message
+        self.image_path = image_path
+        self.loop = loop
+        self.dispatch_mode = dispatch_mode
+        self.status = "pending"
+        self.progress = {"success": 0, "failed": 0, "total": 0, "loop_count": 0}
+        self.log: deque[str] = deque(maxlen=50)
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+    
+    def start(self) -> asyncio.Task:
+        self.task = asyncio.create_task(self._run())
+        return self.task
+    
+    def _callback(self, title, success, msg):
+        self.log.append(msg.strip())
+        self.progress["loop_count"] = self.sender.loop_count
+        
+        if success is not None:
+            self.progress["total"] += 1
+            self.progress["success" if success else "failed"] += 1
+    
+    async def _run(self):
+        if self.status != "pending":
+            return
+        
+        self.status = "running"
+        try:
+            results = await self.sender.send_to_groups(
+                self.groups,
+                self.message,
+                self.image_path,
+                loop=self.loop,
+                callback=self._callback,
+                dispatch_mode=self.dispatch_mode
+            )
+            self.progress.update(results)
+            if self.status == "running":
+                self.status = "done"
+        except Exception as e:
+            self.status = "failed"
+            self.log.append(f"Görev hatası: {e}")
+        finally:
+            if self.status == "cancelling":
+                self.status = "cancelled"
+            self.finished_at = time.time()
+    
+    def cancel(self):
+        if self.status == "pending":
+            self.status = "cancelled"
+            self.finished_at = time.time()
+        elif self.status == "running":
+            self.status = "cancelling"
+            self.sender.stop()
+            if self.task:
+                self.task.cancel()
+    
+    def is_active(self) -> bool:
+        return self.status in ("pending", "running")
+    
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "account": self.account,
+            "status": self.status,
+            "loop": self.loop,
+            "groups": len(self.groups),
+            "progress": dict(self.progress),
+            "log": list(self.log)[-10:],
+            "created_at": self.created_at,
+            "finished_at": self.finished_at
+        }
@@ -0,0 +1,140 @@
+import sqlite3
+from pathlib import Path
+from typing import Optional
+import config
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS send_attempts (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    account TEXT NOT NULL,
+    chat_id INTEGER NOT NULL,
+    title TEXT,
+    outcome TEXT NOT NULL,
+    latency_ms INTEGER NOT NULL,
+    loop_index INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_attempts_chat_ts ON send_attempts (chat_id, ts);
+CREATE INDEX IF NOT EXISTS idx_attempts_latency ON send_attempts (latency_ms);
+
+CREATE TABLE IF NOT EXISTS chat_outcome_totals (
+    chat_id INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    latency_ms_sum INTEGER NOT NULL,
+    last_ts REAL NOT NULL,
+    title TEXT,
+    PRIMARY KEY (chat_id, outcome)
+) WITHOUT ROWID;
+"""
+
+INSERT_ATTEMPT = """
+INSERT INTO send_attempts (ts, account, chat_id, title, outcome, latency_ms, loop_index)
+VALUES (:ts, :account, :chat_id, :title, :outcome, :latency_ms, :loop_index)
+"""
+
+UPSERT_TOTALS = """
+INSERT INTO chat_outcome_totals (chat_id, outcome, attempts, latency_ms_sum, last_ts, title)
+VALUES (:chat_id, :outcome, 1, :latency_ms, :ts, :title)
+ON CONFLICT (chat_id, outcome) DO UPDATE SET
+    attempts = attempts + 1,
+    latency_ms_sum = latency_ms_sum + excluded.latency_ms_sum,
+    last_ts = MAX(last_ts, excluded.last_ts),
+    title = excluded.title
+"""
+
+
+class SendStatsStore:
+    
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = db_path or config.STATS_DB_PATH
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+    
+    def record_batch(self, records: list[dict]) -> int:
+        if not records:
+            return 0
+        
+        with self.conn:
+            self.conn.executemany(INSERT_ATTEMPT, records)
+            self.conn.executemany(UPSERT_TOTALS, records)
+        return len(records)
+    
+    def last_sent_times(self) -> dict[int, float]:
+        rows = self.conn.execute(
+            "SELECT chat_id, MAX(last_ts) FROM chat_outcome_totals GROUP BY chat_id"
+        ).fetchall()
+        return dict(rows)
+    
+    def chat_report(self, limit: int = 50) -> list[dict]:
+        rows = self.conn.execute(
+            """
+            SELECT chat_id,
+                   MAX(title),
+                   SUM(attempts),
+                   SUM(CASE WHEN outcome = 'ok' THEN attempts ELSE 0 END),
+                   SUM(latency_ms_sum),
+                   MAX(last_ts)
+            FROM chat_outcome_totals
+            GROUP BY chat_id
+            ORDER BY 1.0 * SUM(CASE WHEN outcome = 'ok' THEN attempts ELSE 0 END) / SUM(attempts),
+                     SUM(attempts) DESC
+            LIMIT ?
+            """,
+            (limit,)
+        ).fetchall()
+        
+        report = []
+        for chat_id, title, attempts, successes, latency_sum, last_ts in rows:
+            report.append({
+                "chat_id": chat_id,
+                "title": title,
+                "attempts": attempts,
+                "success": successes,
+                "success_rate": successes / attempts if attempts else 0.0,
+                "avg_latency_ms": latency_sum / attempts if attempts else 0.0,
+                "last_ts": last_ts
+            })
+        return report
+    
+    def error_breakdown(self) -> list[dict]:
+        rows = self.conn.execute(
+            """
+            SELECT outcome, SUM(attempts), COUNT(*)
+            FROM chat_outcome_totals
+            WHERE outcome != 'ok'
+            GROUP BY outcome
+            ORDER BY SUM(attempts) DESC
+            """
+        ).fetchall()
+        return [
+            {"outcome": outcome, "attempts": attempts, "chats": chats}
+            for outcome, attempts, chats in rows
+        ]
+    
+    def latency_percentiles(self, percentiles=(0.5, 0.9, 0.99)) -> dict[float, Optional[int]]:
+        total = self.conn.execute("SELECT COUNT(*) FROM send_attempts").fetchone()[0]
+        result: dict[float, Optional[int]] = {}
+        
+        for p in percentiles:
+            if not total:
+                result[p] = None
+                continue
+            
+            offset = min(total - 1, int(p * total))
+            row = self.conn.execute(
+                "SELECT latency_ms FROM send_attempts ORDER BY latency_ms LIMIT 1 OFFSET ?",
+                (offset,)
+            ).fetchone()
+            result[p] = row[0] if row else None
+        return result
+    
+    def total_attempts(self) -> int:
+        row = self.conn.execute("SELECT SUM(attempts) FROM chat_outcome_totals").fetchone()
+        return row[0] or 0
+    
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,133 @@
+import json
+import os
+from pathlib import Path
+from typing import Optional
+import config
+
+
+DELAY_KEYS = ("message_delay", "group_delay", "loop_delay")
+DISPATCH_MODES = ("direct", "forward", "copy")
+SLOW_MODE_TYPE = "Yavaş Mod"
+GROUP_TYPES = ("Grup", "Süper Grup", "Kanal", SLOW_MODE_TYPE)
+
+
+class SenderSettings:
+    
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or config.SETTINGS_PATH
+        self.data = self._defaults()
+        self.error: Optional[str] = None
+        self.last_sent: dict[int, float] = {}
+        self._mtime: Optional[float] = None
+        self.reload()
+    
+    def _defaults(self) -> dict:
+        return {
+            "message_delay": config.DEFAULT_MESSAGE_DELAY,
+            "group_delay": config.DEFAULT_GROUP_DELAY,
+            "loop_delay": config.DEFAULT_LOOP_DELAY,
+            "dispatch_mode": config.DEFAULT_DISPATCH_MODE,
+            "group_types": {},
+            "groups": {}
+        }
+    
+    def reload(self, force: bool = False) -> bool:
+        try:
+            mtime = self.path.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        
+        if not force and mtime == self._mtime:
+            return False
+        
+        self._mtime = mtime
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                loaded = json.load(f)
+            self.data = self._validate(loaded)
+            self.error = None
+            return True
+        except (ValueError, TypeError, OSError) as e:
+            self.error = f"Ayar dosyası okunamadı: {e}"
+            return False
+    
+    def _validate(self, loaded: dict) -> dict:
+        if not isinstance(loaded, dict):
+            raise TypeError("JSON nesnesi bekleniyor")
+        
+        data = self._defaults()
+        data.update(self._clean_delays(loaded))
+        
+        dispatch_mode = loaded.get("dispatch_mode", data["dispatch_mode"])
+        if dispatch_mode not in DISPATCH_MODES:
+            raise ValueError(f"'dispatch_mode' şunlardan biri olmalı: {', '.join(DISPATCH_MODES)}")
+        data["dispatch_mode"] = dispatch_mode
+
+        for scope in ("group_types", "groups"):
+            overrides = loaded.get(scope) or {}
+            if not isinstance(overrides, dict):
+                raise TypeError(f"'{scope}' bir nesne olmalı")
+            data[scope] = {
+                str(key): self._clean_delays(values)
+                for key, values in overrides.items()
+                if isinstance(values, dict)
+            }
+        
+        for key, value in loaded.items():
+            data.setdefault(key, value)
+        return data
+    
+    def _clean_delays(self, values: dict) -> dict:
+        cleaned = {}
+        for key in DELAY_KEYS:
+            if key in values:
+                value = values[key]
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    raise TypeError(f"'{key}' sayı olmalı")
+                if value < 0:
+                    raise ValueError(f"'{key}' negatif olamaz")
+                cleaned[key] = value
+        return cleaned
+    
+    def save(self):
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+        self._mtime = self.path.stat().st_mtime
+    
+    def get(self, key: str, group: Optional[dict] = None) -> float:
+        if group is not None:
+            group_override = self.data["groups"].get(str(group.get("id")), {})
+            if key in group_override:
+                return group_override[key]
+            
+            if getattr(group.get("entity"), "slowmode_enabled", False):
+                slow_override = self.data["group_types"].get(SLOW_MODE_TYPE, {})
+                if key in slow_override:
+                    return slow_override[key]
+            
+            type_override = self.data["group_types"].get(group.get("type"), {})
+            if key in type_override:
+                return type_override[key]
+        
+        return self.data[key]
+    
+    def set_defaults(self, **delays):
+        self.data.update(self._clean_delays(delays))
+        self.save()
+    
+    def set_dispatch_mode(self, mode: str):
+        if mode not in DISPATCH_MODES:
+            raise ValueError(f"Geçersiz gönderim modu: {mode}")
+        self.data["dispatch_mode"] = mode
+        self.save()
+    
+    def set_override(self, scope: str, key, **delays):
+        overrides = self.data[scope].setdefault(str(key), {})
+        overrides.update(self._clean_delays(delays))
+        self.save()
+    
+    def clear_override(self, scope: str, key):
+        self.data[scope].pop(str(key), None)
+        self.save()
@@ -4,12 +4,15 @@ from typing import Optional
 from telethon import TelegramClient
 from telethon.errors import SessionPasswordNeededError
 import config
+import async_prompt
+from connection_monitor import ConnectionMonitor
 
 
 class SessionManager:
     
     def __init__(self):
         self.clients: dict[str, TelegramClient] = {}
+        self.monitors: dict[str, ConnectionMonitor] = {}
         self.active_client: Optional[TelegramClient] = None
         self.active_phone: Optional[str] = None
     
@@ -32,33 +35,36 @@ class SessionManager:
         )
         return client
     
-    async def login(self, phone: str) -> tuple[bool, str]:
+    async def login(
+        self,
+        phone: str,
+        code_callback=None,
+        password_callback=None
+    ) -> tuple[bool, str]:
+        code_callback = code_callback or (lambda: async_prompt.ask("Kod"))
+        password_callback = password_callback or (lambda: async_prompt.ask("Şifre", password=True))
         client = self.create_client(phone)
         
         try:
             await client.connect()
             
             if await client.is_user_authorized():
-                self.clients[phone] = client
-                self.active_client = client
-                self.active_phone = phone
+                self._register_client(phone, client)
                 return True, "Önceki oturum ile giriş yapıldı."
             
             await client.send_code_request(phone)
             
             print("\n📱 Telegram'dan gelen doğrulama kodunu girin:")
-            code = input("Kod: ").strip()
+            code = (await code_callback()).strip()
             
             try:
                 await client.sign_in(phone, code)
             except SessionPasswordNeededError:
                 print("\n🔐 2FA şifresi gerekli:")
-                password = input("Şifre: ").strip()
+                password = (await password_callback()).strip()
                 await client.sign_in(password=password)
             
-            self.clients[phone] = client
-            self.active_client = client
-            self.active_phone = phone
+            self._register_client(phone, client)
             
             me = await client.get_me()
             return True, f"Giriş başarılı! Hoş geldin, {me.first_name}!"
@@ -79,9 +85,7 @@ class SessionManager:
             await client.connect()
             
             if await client.is_user_authorized():
-                self.clients[phone] = client
-                self.active_client = client
-                self.active_phone = phone
+                self._register_client(phone, client)
                 
                 me = await client.get_me()
                 return True, f"Session yüklendi! Hoş geldin, {me.first_name}!"
@@ -93,7 +97,19 @@ class SessionManager:
             await client.disconnect()
             return False, f"Session yükleme hatası: {str(e)}"
     
+    def _register_client(self, phone: str, client: TelegramClient):
+        self.clients[phone] = client
+        self.active_client = client
+        self.active_phone = phone
+        
+        monitor = ConnectionMonitor(client)
+        monitor.start()
+        self.monitors[phone] = monitor
+    
     async def logout(self, phone: str) -> tuple[bool, str]:
+        if phone in self.monitors:
+            await self.monitors.pop(phone).stop()
+        
         if phone in self.clients:
             client = self.clients[phone]
             try:
@@ -115,6 +131,10 @@ class SessionManager:
         return True, "Çıkış yapıldı ve session silindi."
     
     async def disconnect_all(self):
+        for monitor in self.monitors.values():
+            await monitor.stop()
+        self.monitors.clear()
+        
         for phone, client in self.clients.items():
             try:
                 await client.disconnect()
@@ -129,3 +149,6 @@ class SessionManager:
     
     def get_active_phone(self) -> Optional[str]:
         return self.active_phone
+    
+    def get_monitor(self, phone: Optional[str]) -> Optional[ConnectionMonitor]:
+        return self.monitors.get(phone)